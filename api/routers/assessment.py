@@ -4,6 +4,8 @@ Assessment router — question engine endpoints for adaptive filtering + scoring
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from fastapi import APIRouter
 
 from api.models import (
@@ -68,6 +70,27 @@ for _pd in PROGRESSIVE_DISCLOSURE:
             _TRIGGER_IDS.add(_cond["question_id"])
 
 
+@lru_cache(maxsize=None)
+def _question_payload(qid: str) -> dict:
+    """Static part of a visible question's payload (everything but answered)."""
+    q = QUESTIONS[qid]
+    return {
+        "id": qid,
+        "text": q["text"],
+        "help": QUESTION_HELP.get(qid, ""),
+        "type": q["type"],
+        "dimension": q["dimension"],
+        "weight": q.get("weight", 1.0),
+        "options": q.get("options", []),
+        "min": q.get("min"),
+        "max": q.get("max"),
+        "unit": q.get("unit"),
+        "labels": q.get("labels"),
+        "inverse": q.get("inverse", False),
+        "scoring_order": q.get("scoring_order", "ascending"),
+    }
+
+
 @router.post("/assessment/visible", response_model=VisibleResponse)
 async def get_visible(req: VisibleRequest):
     """Get visible questions with adaptive filtering applied."""
@@ -85,10 +108,7 @@ async def get_visible(req: VisibleRequest):
         for qlist in ("capability_questions", "operational_questions",
                       "conditional_questions", "branch_questions"):
             for qid in cat.get(qlist, []):
-                if qid not in visible_set:
-                    continue
-                q = QUESTIONS.get(qid)
-                if q is None:
+                if qid not in visible_set or qid not in QUESTIONS:
                     continue
 
                 is_answered = qid in req.answers
@@ -96,19 +116,7 @@ async def get_visible(req: VisibleRequest):
                     total_answered += 1
 
                 cat_questions.append({
-                    "id": qid,
-                    "text": q["text"],
-                    "help": QUESTION_HELP.get(qid, ""),
-                    "type": q["type"],
-                    "dimension": q["dimension"],
-                    "weight": q.get("weight", 1.0),
-                    "options": q.get("options", []),
-                    "min": q.get("min"),
-                    "max": q.get("max"),
-                    "unit": q.get("unit"),
-                    "labels": q.get("labels"),
-                    "inverse": q.get("inverse", False),
-                    "scoring_order": q.get("scoring_order", "ascending"),
+                    **_question_payload(qid),
                     "answered": is_answered,
                     "adaptive": qid in _ADAPTIVE_IDS,
                     "trigger": qid in _TRIGGER_IDS,
@@ -25,7 +25,7 @@ from dimension_slider_mapping import (
     SLIDER_SHORT,
     DIMENSION_SHORT,
 )
-from lib.descriptions import ARCHETYPE_DESCRIPTIONS, PERSONA_DESCRIPTIONS
+from lib.descriptions import get_archetype_description, get_persona_description
 from mira_bridge import PERSONA_CONTEXTS, PERSONA_EXPECTED
 from lib.mira_questions import QUESTIONS, CATEGORIES
 
@@ -56,7 +56,7 @@ def _build_archetype_meta() -> dict[str, Any]:
             "dimensions": dims,
             "default_position": list(pos),
             "default_sliders": list(sliders),
-            "description": ARCHETYPE_DESCRIPTIONS.get(name, ""),
+            "description": get_archetype_description(name),
         }
 
     # Persona list for identification page
@@ -64,7 +64,7 @@ def _build_archetype_meta() -> dict[str, Any]:
     for key, ctx in PERSONA_CONTEXTS.items():
         expected = PERSONA_EXPECTED.get(key, [])
         personas[key] = {
-            "description": PERSONA_DESCRIPTIONS.get(key, ""),
+            "description": get_persona_description(key),
             "expected_archetypes": expected,
             "context": ctx.get("context", {}),
         }
@@ -697,6 +697,10 @@ def residual_report(model: SliderModel, use_state: bool = False,
 # Sensitivity analysis
 # ---------------------------------------------------------------------------
 
+# Row templates for the per-dimension and per-persona report loops
+_DIMENSION_ROW = "{dim:<10} {inv:>10.3f} {rec:>10.3f} {owk:>10.3f} {time:>10.3f}"
+_PERSONA_ROW = "{persona:<28} {s_mae:>8.3f} {c_mae:>10.3f} {delta:>+8.3f}  {state}"
+
 def slider_sensitivity(model: SliderModel, base_dimensions: list[int],
                        dimension_idx: int) -> dict:
     """Vary one dimension across 1-5, hold others fixed. Return slider values."""
@@ -714,11 +718,15 @@ def slider_sensitivity(model: SliderModel, base_dimensions: list[int],
 
 def sensitivity_matrix(model: SliderModel,
                        base_dimensions: Optional[list[int]] = None,
-                       verbose: bool = True) -> dict:
+                       verbose: bool = True) -> tuple[dict, np.ndarray]:
     """Full sensitivity analysis: all 8 dimensions x all 4 sliders.
 
     For each dimension, shows how each slider changes as that dimension
     moves from 1 to 5 (others held at base values).
+
+    Returns (results, ranges_mat): results maps each dimension index to
+    its sensitivity and per-slider ranges; ranges_mat is the same range
+    table as an (8, 4) ndarray.
     """
     if base_dimensions is None:
         # Default: mid-range profile [3,3,3,3,3,3,3,3]
@@ -726,16 +734,18 @@ def sensitivity_matrix(model: SliderModel,
 
     base_sliders = model.compute_all(base_dimensions)
     results = {}
+    # (8, 4) dimension x slider ranges; lists are only built for the
+    # per-dimension entries once all indexing below is done.
+    ranges_mat = np.empty((8, 4))
 
     for d_idx in range(8):
         sens = slider_sensitivity(model, base_dimensions, d_idx)
         # Compute range (max - min) for each slider across D=1..5
         all_vals = np.array([sens[level]["values"] for level in range(1, 6)])
-        ranges = all_vals.max(axis=0) - all_vals.min(axis=0)
+        ranges_mat[d_idx] = all_vals.max(axis=0) - all_vals.min(axis=0)
         results[d_idx] = {
             "dimension": DIMENSION_SHORT[d_idx],
             "sensitivity": sens,
-            "ranges": ranges.tolist(),
         }
 
     if verbose:
@@ -744,9 +754,9 @@ def sensitivity_matrix(model: SliderModel,
               f"{'Owk range':>10} {'Time range':>10}")
         print("-" * 55)
         for d_idx in range(8):
-            r = results[d_idx]["ranges"]
-            print(f"{DIMENSION_SHORT[d_idx]:<10} {r[0]:>10.3f} {r[1]:>10.3f} "
-                  f"{r[2]:>10.3f} {r[3]:>10.3f}")
+            inv, rec, owk, tim = ranges_mat[d_idx]
+            print(_DIMENSION_ROW.format(dim=DIMENSION_SHORT[d_idx], inv=inv,
+                                        rec=rec, owk=owk, time=tim))
 
         print(f"\nBase slider values: ", end="")
         for name, val in zip(SLIDER_SHORT, base_sliders):
@@ -756,13 +766,16 @@ def sensitivity_matrix(model: SliderModel,
         # Identify top-2 most influential dimensions per slider
         print("\nTop-2 influential dimensions per slider:")
         for s_idx, s_name in enumerate(SLIDER_SHORT):
-            dim_ranges = [(results[d]["ranges"][s_idx], d) for d in range(8)]
-            dim_ranges.sort(reverse=True)
-            top2 = dim_ranges[:2]
-            print(f"  {s_name:<12}: {DIMENSION_SHORT[top2[0][1]]} ({top2[0][0]:.3f}), "
-                  f"{DIMENSION_SHORT[top2[1][1]]} ({top2[1][0]:.3f})")
+            col = ranges_mat[:, s_idx]
+            top2 = np.argpartition(col, -2)[-2:]
+            first, second = top2[np.argsort(col[top2])[::-1]]
+            print(f"  {s_name:<12}: {DIMENSION_SHORT[first]} ({col[first]:.3f}), "
+                  f"{DIMENSION_SHORT[second]} ({col[second]:.3f})")
 
-    return results
+    for d_idx, row in enumerate(ranges_mat.tolist()):
+        results[d_idx]["ranges"] = row
+
+    return results, ranges_mat
 
 
 # ---------------------------------------------------------------------------
@@ -862,7 +875,8 @@ def main() -> None:
         if state.resource_erosion != "none":
             state_desc.append(f"erosion={state.resource_erosion}")
         state_str = ", ".join(state_desc) if state_desc else "(structural only)"
-        print(f"{s['persona']:<28} {s['mae']:>8.3f} {c['mae']:>10.3f} {delta:>+8.3f}  {state_str}")
+        print(_PERSONA_ROW.format(persona=s["persona"], s_mae=s["mae"],
+                                  c_mae=c["mae"], delta=delta, state=state_str))
 
     # 5. LOO-CV (structural layer only — state modifiers are domain-derived, not fitted)
     print("\n--- Phase 5: Leave-One-Out Cross-Validation (Layer 1) ---")
@@ -5,8 +5,11 @@ Extracted from components.py so the API can import these without pulling in
 streamlit, plotly, or numpy.
 """
 
+import sys
+from types import MappingProxyType
+
 # Archetype descriptions — what each project type represents
-ARCHETYPE_DESCRIPTIONS = {
+_ARCHETYPE_TEXT = {
     "#1 Micro Startup": (
         "1-3 person team, no process, pure hustle. Moving fast with minimal governance. "
         "Success depends almost entirely on individual effort and speed to market."
@@ -70,54 +73,80 @@ ARCHETYPE_DESCRIPTIONS = {
 }
 
 # Persona descriptions — human-readable explanations for the feedback page.
-# Each has a brief context line and a narrative quote from the research definitions.
-PERSONA_DESCRIPTIONS = {
+# Each has a brief context line and a narrative quote from the research
+# definitions; the two are joined (quote wrapped) once at import.
+_QUOTE_WRAP = '{} "{}"'
+_PERSONA_PARTS = {
     "P1 Startup Chaos": (
-        "3\u20138 person startup, no regulation, shipping through heroics and client proximity. "
-        "\"You're delivering through effort, not process. That works until it doesn't.\""
+        "3\u20138 person startup, no regulation, shipping through heroics and client proximity.",
+        "You're delivering through effort, not process. That works until it doesn't.",
     ),
     "P2 Small Agile Team": (
-        "8\u201315 person team, real agile ceremonies, tribal knowledge instead of documentation. "
-        "\"Your team makes this work. Your process doesn't. What happens when the team changes?\""
+        "8\u201315 person team, real agile ceremonies, tribal knowledge instead of documentation.",
+        "Your team makes this work. Your process doesn't. What happens when the team changes?",
     ),
     "P3 Government Waterfall": (
-        "50\u2013100 person public-sector project, heavy compliance, manual stage-gated delivery. "
-        "\"You have the structure. Now you need the speed. Process without agility is just expensive documentation.\""
+        "50\u2013100 person public-sector project, heavy compliance, manual stage-gated delivery.",
+        "You have the structure. Now you need the speed. Process without agility is just expensive documentation.",
     ),
     "P4 Enterprise Financial": (
-        "200+ person regulated financial platform (SOX, PCI-DSS), mature pipelines, heavy outsourcing. "
-        "\"Your machine works, but increasingly it's other people's machines bolted onto yours.\""
+        "200+ person regulated financial platform (SOX, PCI-DSS), mature pipelines, heavy outsourcing.",
+        "Your machine works, but increasingly it's other people's machines bolted onto yours.",
     ),
     "P5 Medical Device": (
-        "20\u201350 person safety-critical product (FDA, IEC 62304), slow by design \u2014 lives depend on it. "
-        "\"Your process exists for a reason \u2014 people's lives. The challenge is keeping it sustainable.\""
+        "20\u201350 person safety-critical product (FDA, IEC 62304), slow by design \u2014 lives depend on it.",
+        "Your process exists for a reason \u2014 people's lives. The challenge is keeping it sustainable.",
     ),
     "P6 Failing Automation": (
-        "30\u201360 person growth-stage team, significant automation investment that isn't translating to delivery. "
-        "\"You bought the tools before you built the foundations. Your automation is now technical debt wearing a quality hat.\""
+        "30\u201360 person growth-stage team, significant automation investment that isn't translating to delivery.",
+        "You bought the tools before you built the foundations. Your automation is now technical debt wearing a quality hat.",
     ),
     "P7 Cloud-Native": (
-        "15\u201330 person DevOps team, greenfield product, modern tooling, untested at scale. "
-        "\"You've built a perfect island and declared the sea somebody else's problem.\""
+        "15\u201330 person DevOps team, greenfield product, modern tooling, untested at scale.",
+        "You've built a perfect island and declared the sea somebody else's problem.",
     ),
     "P8 Late-Stage UAT Crisis": (
-        "80\u2013150+ person project in late delivery, UAT haemorrhaging defects, every gate rubber-stamped. "
-        "\"You built what you thought was right, not what the customer asked for.\""
+        "80\u2013150+ person project in late delivery, UAT haemorrhaging defects, every gate rubber-stamped.",
+        "You built what you thought was right, not what the customer asked for.",
     ),
     "P9 Planning Phase": (
-        "20\u201340 person team starting a new project, nothing built yet \u2014 all metrics are blank or baseline. "
-        "\"You have the luxury of time and a clean slate. Every decision you make now compounds through the lifecycle.\""
+        "20\u201340 person team starting a new project, nothing built yet \u2014 all metrics are blank or baseline.",
+        "You have the luxury of time and a clean slate. Every decision you make now compounds through the lifecycle.",
     ),
     "P10 Golden Enterprise": (
-        "150\u2013300 person mature company with genuine engineering culture, sustainable pace, quality by conviction. "
-        "\"You've built something rare \u2014 a quality culture that sustains itself. Guard against the slow drift.\""
+        "150\u2013300 person mature company with genuine engineering culture, sustainable pace, quality by conviction.",
+        "You've built something rare \u2014 a quality culture that sustains itself. Guard against the slow drift.",
     ),
     "P11 Automotive Embedded": (
-        "200+ person multi-tier automotive programme (ISO 26262, ASPICE), compliance-driven with deep supplier chains. "
-        "\"You've built a compliance fortress around a trust vacuum.\""
+        "200+ person multi-tier automotive programme (ISO 26262, ASPICE), compliance-driven with deep supplier chains.",
+        "You've built a compliance fortress around a trust vacuum.",
     ),
     "P12 Legacy Modernisation": (
-        "5\u201312 person team maintaining a 15-year system, tribal knowledge, retirement risk, forced modernisation. "
-        "\"Your system runs on institutional memory, not process. Every retirement letter is a risk event.\""
+        "5\u201312 person team maintaining a 15-year system, tribal knowledge, retirement risk, forced modernisation.",
+        "Your system runs on institutional memory, not process. Every retirement letter is a risk event.",
     ),
 }
+_PERSONA_TEXT = {
+    name: _QUOTE_WRAP.format(context, quote)
+    for name, (context, quote) in _PERSONA_PARTS.items()
+}
+
+
+def _freeze(table: dict[str, str]) -> MappingProxyType:
+    """Read-only view over a copy of table with interned keys and values."""
+    return MappingProxyType({sys.intern(k): sys.intern(v) for k, v in table.items()})
+
+
+# Public lookups are read-only, so one shared copy can't be mutated by a caller
+ARCHETYPE_DESCRIPTIONS = _freeze(_ARCHETYPE_TEXT)
+PERSONA_DESCRIPTIONS = _freeze(_PERSONA_TEXT)
+
+
+def get_archetype_description(name: str) -> str:
+    """Description for an archetype name, or "" if it has none."""
+    return ARCHETYPE_DESCRIPTIONS.get(name, "")
+
+
+def get_persona_description(name: str) -> str:
+    """Description for a persona name, or "" if it has none."""
+    return PERSONA_DESCRIPTIONS.get(name, "")
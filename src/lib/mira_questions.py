@@ -12,7 +12,7 @@ Excludes:
 
 from __future__ import annotations
 
-from collections import OrderedDict
+from types import MappingProxyType
 
 # ---------------------------------------------------------------------------
 # Question type constants
@@ -32,6 +32,25 @@ CUSTOM = "custom"            # Explicit value_scores mapping
 UNSCORED = "unscored"       # Doesn't contribute to maturity score
 GAP = "gap"                  # Gap scoring (0 = no gap = best)
 
+# Options shared by every toggle question
+_YES_NO = ({"value": True, "label": "Yes"}, {"value": False, "label": "No"})
+
+# Options shared by more than one select question
+_PROPORTION = (
+    {"value": "none", "label": "None"},
+    {"value": "few", "label": "A few"},
+    {"value": "some", "label": "Some"},
+    {"value": "most", "label": "Most"},
+    {"value": "all", "label": "All or nearly all"},
+)
+_COUNT_BANDS = (
+    {"value": "none", "label": "None"},
+    {"value": "few", "label": "Few (1\u20133)"},
+    {"value": "several", "label": "Several (4\u20138)"},
+    {"value": "many", "label": "Many (9\u201315)"},
+    {"value": "extensive", "label": "Extensive (15+)"},
+)
+
 
 # ---------------------------------------------------------------------------
 # QUESTIONS — all maturity question definitions
@@ -49,17 +68,17 @@ GAP = "gap"                  # Gap scoring (0 = no gap = best)
 # Slider: normalised as (value - min) / (max - min) * 100.
 # ---------------------------------------------------------------------------
 
-QUESTIONS = OrderedDict([
+QUESTIONS: dict[str, dict] = {
 
     # ===== GOVERNANCE =====
 
-    ("GOV-C1", {
+    "GOV-C1": {
         "text": "Is there a dedicated Test Manager/Lead?",
         "category": "governance", "dimension": "capability",
         "type": TYPE_TOGGLE, "weight": 1.00,
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("GOV-C2", {
+        "options": _YES_NO,
+    },
+    "GOV-C2": {
         "text": "Does the Test Lead have authority to stop releases on quality grounds?",
         "category": "governance", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.65,
@@ -69,8 +88,8 @@ QUESTIONS = OrderedDict([
             {"value": "can_delay", "label": "Can delay"},
             {"value": "can_stop", "label": "Can stop"},
         ],
-    }),
-    ("GOV-C3", {
+    },
+    "GOV-C3": {
         "text": "Are quality gates defined with entry/exit criteria?",
         "category": "governance", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.65,
@@ -80,8 +99,8 @@ QUESTIONS = OrderedDict([
             {"value": "defined", "label": "Defined"},
             {"value": "enforced", "label": "Enforced with metrics"},
         ],
-    }),
-    ("GOV-C4", {
+    },
+    "GOV-C4": {
         "text": "Who makes release decisions?",
         "category": "governance", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -92,8 +111,8 @@ QUESTIONS = OrderedDict([
             {"value": "pm_alone", "label": "PM alone"},
             {"value": "business_pressure", "label": "Business pressure"},
         ],
-    }),
-    ("GOV-O1", {
+    },
+    "GOV-O1": {
         "text": "When did Test expertise join the project?",
         "category": "governance", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -105,8 +124,8 @@ QUESTIONS = OrderedDict([
             {"value": "testing_phase", "label": "Testing phase"},
             {"value": "no_dedicated", "label": "No dedicated lead"},
         ],
-    }),
-    ("GOV-O2", {
+    },
+    "GOV-O2": {
         "text": "How widely are dedicated test leads deployed across teams?",
         "category": "governance", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -117,8 +136,8 @@ QUESTIONS = OrderedDict([
             {"value": "most", "label": "Most teams"},
             {"value": "all", "label": "All teams"},
         ],
-    }),
-    ("GOV-O3", {
+    },
+    "GOV-O3": {
         "text": "What is the quality gate pass/waiver rate?",
         "category": "governance", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.50,
@@ -129,14 +148,14 @@ QUESTIONS = OrderedDict([
             {"value": "many_waivers", "label": "Many waivers"},
             {"value": "gates_ignored", "label": "Gates ignored"},
         ],
-    }),
-    ("GOV-O4", {
+    },
+    "GOV-O4": {
         "text": "Is there a test leadership development path?",
         "category": "governance", "dimension": "capability",
         "type": TYPE_TOGGLE, "weight": 0.60,
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("GOV-O5", {
+        "options": _YES_NO,
+    },
+    "GOV-O5": {
         "text": "Are test-related decisions documented?",
         "category": "governance", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.60,
@@ -146,11 +165,11 @@ QUESTIONS = OrderedDict([
             {"value": "usually", "label": "Usually"},
             {"value": "always", "label": "Always"},
         ],
-    }),
+    },
 
     # ===== TEST STRATEGY =====
 
-    ("TST-C1", {
+    "TST-C1": {
         "text": "Is there a documented test strategy?",
         "category": "test_strategy", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.65,
@@ -160,8 +179,8 @@ QUESTIONS = OrderedDict([
             {"value": "documented", "label": "Documented"},
             {"value": "approved_maintained", "label": "Approved & maintained"},
         ],
-    }),
-    ("TST-C2", {
+    },
+    "TST-C2": {
         "text": "Is the test approach risk-based?",
         "category": "test_strategy", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.50,
@@ -171,14 +190,14 @@ QUESTIONS = OrderedDict([
             {"value": "yes_business_input", "label": "Yes, with business input"},
             {"value": "quantified_risk_model", "label": "Quantified risk model"},
         ],
-    }),
-    ("TST-C3", {
+    },
+    "TST-C3": {
         "text": "Is there a documented automation strategy?",
         "category": "test_strategy", "dimension": "capability",
         "type": TYPE_TOGGLE, "weight": 1.00,
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("TST-C4", {
+        "options": _YES_NO,
+    },
+    "TST-C4": {
         "text": "Is test estimation based on historical data?",
         "category": "test_strategy", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -188,8 +207,8 @@ QUESTIONS = OrderedDict([
             {"value": "some_data", "label": "Some data"},
             {"value": "data_driven", "label": "Data-driven model"},
         ],
-    }),
-    ("TST-O1", {
+    },
+    "TST-O1": {
         "text": "Test type balance (functional, NFR, integration, regression)?",
         "category": "test_strategy", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -199,8 +218,8 @@ QUESTIONS = OrderedDict([
             {"value": "most_types", "label": "Most types"},
             {"value": "comprehensive", "label": "Comprehensive"},
         ],
-    }),
-    ("TST-O2", {
+    },
+    "TST-O2": {
         "text": "What level of requirements coverage do tests achieve?",
         "category": "test_strategy", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.50,
@@ -211,8 +230,8 @@ QUESTIONS = OrderedDict([
             {"value": "good", "label": "Good (most requirements)"},
             {"value": "comprehensive", "label": "Comprehensive (nearly all)"},
         ],
-    }),
-    ("TST-O3", {
+    },
+    "TST-O3": {
         "text": "What is the defect escape rate to production?",
         "category": "test_strategy", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.50,
@@ -223,8 +242,8 @@ QUESTIONS = OrderedDict([
             {"value": "low", "label": "Low (5-10%)"},
             {"value": "very_low", "label": "Very low (<5%)"},
         ],
-    }),
-    ("TST-O4", {
+    },
+    "TST-O4": {
         "text": "Are test metrics collected and analysed?",
         "category": "test_strategy", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.60,
@@ -234,8 +253,8 @@ QUESTIONS = OrderedDict([
             {"value": "analysed", "label": "Analysed"},
             {"value": "actioned", "label": "Analysed and actioned"},
         ],
-    }),
-    ("TST-O5", {
+    },
+    "TST-O5": {
         "text": "Is test execution aligned with release cycles?",
         "category": "test_strategy", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 0.60,
@@ -245,29 +264,29 @@ QUESTIONS = OrderedDict([
             {"value": "aligned", "label": "Aligned"},
             {"value": "integrated", "label": "Fully integrated"},
         ],
-    }),
+    },
 
     # ===== TEST ASSETS =====
 
-    ("TAM-C1", {
+    "TAM-C1": {
         "text": "Is there a test suite health monitoring process?",
         "category": "test_assets", "dimension": "capability",
         "type": TYPE_TOGGLE, "weight": 1.00,
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("TAM-C2", {
+        "options": _YES_NO,
+    },
+    "TAM-C2": {
         "text": "Is there a test retirement/pruning process?",
         "category": "test_assets", "dimension": "capability",
         "type": TYPE_TOGGLE, "weight": 1.00,
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("TAM-C3", {
+        "options": _YES_NO,
+    },
+    "TAM-C3": {
         "text": "Is automation ROI measured or understood?",
         "category": "test_assets", "dimension": "capability",
         "type": TYPE_TOGGLE, "weight": 1.00,
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("TAM-O1", {
+        "options": _YES_NO,
+    },
+    "TAM-O1": {
         "text": "What is the current automation state?",
         "category": "test_assets", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -283,8 +302,8 @@ QUESTIONS = OrderedDict([
             {"value": "struggling", "label": "Struggling"},
             {"value": "failing", "label": "Failing/abandoned"},
         ],
-    }),
-    ("TAM-O2", {
+    },
+    "TAM-O2": {
         "text": "How often do tests fail intermittently (flakiness)?",
         "category": "test_assets", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -296,8 +315,8 @@ QUESTIONS = OrderedDict([
             {"value": "high", "label": "High (frequent false failures)"},
             {"value": "severe", "label": "Severe (results unreliable)"},
         ],
-    }),
-    ("TAM-O3", {
+    },
+    "TAM-O3": {
         "text": "How much test effort goes to maintenance vs building new coverage?",
         "category": "test_assets", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.15,
@@ -309,18 +328,18 @@ QUESTIONS = OrderedDict([
             {"value": "mostly_maintenance", "label": "Mostly maintenance"},
             {"value": "almost_all_maintenance", "label": "Almost all maintenance"},
         ],
-    }),
-    ("TAM-O4", {
+    },
+    "TAM-O4": {
         "text": "Rate team trust in automation results",
         "category": "test_assets", "dimension": "operational",
         "type": TYPE_SLIDER, "weight": 1.65,
         "min": 1, "max": 10,
         "labels": {"min": "No trust, failures ignored", "max": "Full trust, drives decisions"},
-    }),
+    },
 
     # ===== DEVELOPMENT PRACTICES =====
 
-    ("DEV-C1", {
+    "DEV-C1": {
         "text": "Are coding standards defined and enforced?",
         "category": "development", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.30,
@@ -330,8 +349,8 @@ QUESTIONS = OrderedDict([
             {"value": "enforced_manual", "label": "Enforced manually"},
             {"value": "automated", "label": "Automated enforcement"},
         ],
-    }),
-    ("DEV-C2", {
+    },
+    "DEV-C2": {
         "text": "Is there a mandatory code review process?",
         "category": "development", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.15,
@@ -341,8 +360,8 @@ QUESTIONS = OrderedDict([
             {"value": "mandatory", "label": "Mandatory"},
             {"value": "mandatory_metrics", "label": "Mandatory with metrics"},
         ],
-    }),
-    ("DEV-C3", {
+    },
+    "DEV-C3": {
         "text": "Are unit testing expectations defined?",
         "category": "development", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.15,
@@ -352,8 +371,8 @@ QUESTIONS = OrderedDict([
             {"value": "targets", "label": "Targets"},
             {"value": "enforced_gates", "label": "Enforced coverage gates"},
         ],
-    }),
-    ("DEV-C4", {
+    },
+    "DEV-C4": {
         "text": "Is static analysis integrated in the pipeline?",
         "category": "development", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.15,
@@ -363,20 +382,14 @@ QUESTIONS = OrderedDict([
             {"value": "ci_integrated", "label": "CI integrated"},
             {"value": "blocking_gates", "label": "Blocking gates"},
         ],
-    }),
-    ("DEV-O1", {
+    },
+    "DEV-O1": {
         "text": "What proportion of code changes go through review?",
         "category": "development", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.00,
-        "options": [
-            {"value": "none", "label": "None"},
-            {"value": "few", "label": "A few"},
-            {"value": "some", "label": "Some"},
-            {"value": "most", "label": "Most"},
-            {"value": "all", "label": "All or nearly all"},
-        ],
-    }),
-    ("DEV-O2", {
+        "options": _PROPORTION,
+    },
+    "DEV-O2": {
         "text": "What is the unit test coverage level?",
         "category": "development", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.15,
@@ -387,8 +400,8 @@ QUESTIONS = OrderedDict([
             {"value": "good", "label": "Good"},
             {"value": "comprehensive", "label": "Comprehensive"},
         ],
-    }),
-    ("DEV-O3", {
+    },
+    "DEV-O3": {
         "text": "How reliable are builds?",
         "category": "development", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -399,11 +412,11 @@ QUESTIONS = OrderedDict([
             {"value": "reliable", "label": "Reliable (rare failures)"},
             {"value": "very_reliable", "label": "Very reliable (nearly always pass)"},
         ],
-    }),
+    },
 
     # ===== ENVIRONMENT =====
 
-    ("ENV-C1", {
+    "ENV-C1": {
         "text": "Is there a test data strategy (classification, obfuscation, refresh)?",
         "category": "environment", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.60,
@@ -413,8 +426,8 @@ QUESTIONS = OrderedDict([
             {"value": "defined", "label": "Defined"},
             {"value": "comprehensive", "label": "Comprehensive"},
         ],
-    }),
-    ("ENV-C2", {
+    },
+    "ENV-C2": {
         "text": "What is the configuration management approach?",
         "category": "environment", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.60,
@@ -424,8 +437,8 @@ QUESTIONS = OrderedDict([
             {"value": "iac_basic", "label": "IaC basic"},
             {"value": "iac_mature", "label": "IaC mature with CI/CD"},
         ],
-    }),
-    ("ENV-C3", {
+    },
+    "ENV-C3": {
         "text": "What is the deployment model?",
         "category": "environment", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.0,
@@ -436,46 +449,46 @@ QUESTIONS = OrderedDict([
             {"value": "hybrid", "label": "Hybrid"},
             {"value": "edge", "label": "Edge"},
         ],
-    }),
-    ("ENV-O1", {
+    },
+    "ENV-O1": {
         "text": "Rate test environment quality (production-likeness)",
         "category": "environment", "dimension": "operational",
         "type": TYPE_SLIDER, "weight": 0.75,
         "min": 1, "max": 10,
         "labels": {"min": "Poor - nothing like production", "max": "Production-like"},
-    }),
-    ("ENV-O2", {
+    },
+    "ENV-O2": {
         "text": "Rate environment parity (dev/test/prod similarity)",
         "category": "environment", "dimension": "operational",
         "type": TYPE_SLIDER, "weight": 0.60,
         "min": 1, "max": 10,
         "labels": {"min": "Very different", "max": "Identical"},
-    }),
-    ("ENV-O3", {
+    },
+    "ENV-O3": {
         "text": "Rate DevOps/CI-CD maturity",
         "category": "environment", "dimension": "capability",
         "type": TYPE_SLIDER, "weight": 1.15,
         "min": 1, "max": 10,
         "labels": {"min": "Ad-hoc", "max": "Fully automated"},
-    }),
-    ("ENV-O4", {
+    },
+    "ENV-O4": {
         "text": "Rate deployment consistency and reliability",
         "category": "environment", "dimension": "operational",
         "type": TYPE_SLIDER, "weight": 1.15,
         "min": 1, "max": 10,
         "labels": {"min": "Frequent failures", "max": "Highly reliable"},
-    }),
-    ("ENV-O5", {
+    },
+    "ENV-O5": {
         "text": "How well is test data managed and refreshed?",
         "category": "environment", "dimension": "operational",
         "type": TYPE_SLIDER, "weight": 0.60,
         "min": 1, "max": 10,
         "labels": {"min": "No management", "max": "Fully automated"},
-    }),
+    },
 
     # ===== REQUIREMENTS =====
 
-    ("REQ-C1", {
+    "REQ-C1": {
         "text": "Is there a defined requirements elicitation process?",
         "category": "requirements", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.50,
@@ -486,8 +499,8 @@ QUESTIONS = OrderedDict([
             {"value": "managed", "label": "Managed"},
             {"value": "optimised", "label": "Optimised"},
         ],
-    }),
-    ("REQ-C2", {
+    },
+    "REQ-C2": {
         "text": "Are acceptance criteria defined for requirements?",
         "category": "requirements", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -497,8 +510,8 @@ QUESTIONS = OrderedDict([
             {"value": "usually", "label": "Usually"},
             {"value": "always_signoff", "label": "Always with sign-off"},
         ],
-    }),
-    ("REQ-C3", {
+    },
+    "REQ-C3": {
         "text": "Is there a traceability mechanism (requirements to tests to defects)?",
         "category": "requirements", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.50,
@@ -508,20 +521,14 @@ QUESTIONS = OrderedDict([
             {"value": "full_manual", "label": "Full manual"},
             {"value": "tooled", "label": "Tooled"},
         ],
-    }),
-    ("REQ-O1", {
+    },
+    "REQ-O1": {
         "text": "What proportion of requirements have acceptance criteria?",
         "category": "requirements", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.50,
-        "options": [
-            {"value": "none", "label": "None"},
-            {"value": "few", "label": "A few"},
-            {"value": "some", "label": "Some"},
-            {"value": "most", "label": "Most"},
-            {"value": "all", "label": "All or nearly all"},
-        ],
-    }),
-    ("REQ-O2", {
+        "options": _PROPORTION,
+    },
+    "REQ-O2": {
         "text": "How much do requirements change during development?",
         "category": "requirements", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 0.60,
@@ -533,11 +540,11 @@ QUESTIONS = OrderedDict([
             {"value": "high", "label": "High churn (frequent changes)"},
             {"value": "chaotic", "label": "Chaotic (constant flux)"},
         ],
-    }),
+    },
 
     # ===== CHANGE MANAGEMENT =====
 
-    ("CHG-C1", {
+    "CHG-C1": {
         "text": "Is there a baseline management process?",
         "category": "change_management", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -547,8 +554,8 @@ QUESTIONS = OrderedDict([
             {"value": "defined", "label": "Defined"},
             {"value": "controlled", "label": "Controlled"},
         ],
-    }),
-    ("CHG-C2", {
+    },
+    "CHG-C2": {
         "text": "Is there a scope change control process?",
         "category": "change_management", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -558,8 +565,8 @@ QUESTIONS = OrderedDict([
             {"value": "formal", "label": "Formal"},
             {"value": "gate_controlled", "label": "Gate-controlled"},
         ],
-    }),
-    ("CHG-C3", {
+    },
+    "CHG-C3": {
         "text": "Is there a release management process?",
         "category": "change_management", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.60,
@@ -569,8 +576,8 @@ QUESTIONS = OrderedDict([
             {"value": "defined", "label": "Defined"},
             {"value": "automated", "label": "Automated"},
         ],
-    }),
-    ("CHG-O1", {
+    },
+    "CHG-O1": {
         "text": "What is the scope change volume this period?",
         "category": "change_management", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -582,18 +589,18 @@ QUESTIONS = OrderedDict([
             {"value": "high", "label": "High"},
             {"value": "chaotic", "label": "Chaotic"},
         ],
-    }),
-    ("CHG-O2", {
+    },
+    "CHG-O2": {
         "text": "Rate build reproducibility confidence",
         "category": "change_management", "dimension": "operational",
         "type": TYPE_SLIDER, "weight": 0.60,
         "min": 1, "max": 10,
         "labels": {"min": "Unreliable", "max": "Fully reproducible"},
-    }),
+    },
 
     # ===== FEEDBACK & METRICS =====
 
-    ("FBK-C1", {
+    "FBK-C1": {
         "text": "Is there a defect tracking and classification process?",
         "category": "feedback", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -603,8 +610,8 @@ QUESTIONS = OrderedDict([
             {"value": "classified", "label": "Classified by type/severity"},
             {"value": "analysed", "label": "Analysed with root cause"},
         ],
-    }),
-    ("FBK-O1", {
+    },
+    "FBK-O1": {
         "text": "How effective is defect containment (catching defects before production)?",
         "category": "feedback", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 0.60,
@@ -615,8 +622,8 @@ QUESTIONS = OrderedDict([
             {"value": "high", "label": "High"},
             {"value": "very_high", "label": "Very high (nearly all caught)"},
         ],
-    }),
-    ("FBK-O2", {
+    },
+    "FBK-O2": {
         "text": "How often are metrics reviewed and acted upon?",
         "category": "feedback", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 0.60,
@@ -626,11 +633,11 @@ QUESTIONS = OrderedDict([
             {"value": "regularly", "label": "Regularly"},
             {"value": "continuously", "label": "Continuously with actions"},
         ],
-    }),
+    },
 
     # ===== ARCHITECTURE =====
 
-    ("ARC-C1", {
+    "ARC-C1": {
         "text": "What type of system architecture does this project use?",
         "category": "architecture", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.0,
@@ -643,56 +650,56 @@ QUESTIONS = OrderedDict([
             {"value": "embedded", "label": "Embedded"},
             {"value": "hybrid", "label": "Hybrid"},
         ],
-    }),
-    ("ARC-C2", {
+    },
+    "ARC-C2": {
         "text": "Was testability explicitly designed into the architecture?",
         "category": "architecture", "dimension": "capability",
         "type": TYPE_TOGGLE, "weight": 0.60,
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("ARC-C3", {
+        "options": _YES_NO,
+    },
+    "ARC-C3": {
         "text": "Rate how well components can be tested in isolation",
         "category": "architecture", "dimension": "capability",
         "type": TYPE_SLIDER, "weight": 0.60,
         "min": 1, "max": 10,
         "labels": {"min": "Tightly coupled", "max": "Fully isolated"},
-    }),
-    ("ARC-C4", {
+    },
+    "ARC-C4": {
         "text": "Is there a technical debt tracking process?",
         "category": "architecture", "dimension": "capability",
         "type": TYPE_TOGGLE, "weight": 0.60,
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("ARC-C5", {
+        "options": _YES_NO,
+    },
+    "ARC-C5": {
         "text": "Does the project involve legacy code/systems?",
         "category": "architecture", "dimension": "capability",
         "type": TYPE_TOGGLE, "weight": 0.60,
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("ARC-O1", {
+        "options": _YES_NO,
+    },
+    "ARC-O1": {
         "text": "Rate overall architectural complexity",
         "category": "architecture", "dimension": "operational",
         "type": TYPE_SLIDER, "weight": 0.60,
         "min": 1, "max": 10, "inverse": True,
         "labels": {"min": "Simple", "max": "Highly complex"},
-    }),
-    ("ARC-O2", {
+    },
+    "ARC-O2": {
         "text": "Rate system observability and logging maturity",
         "category": "architecture", "dimension": "capability",
         "type": TYPE_SLIDER, "weight": 0.60,
         "min": 1, "max": 10,
         "labels": {"min": "Poor", "max": "Comprehensive"},
-    }),
+    },
 
     # ===== ARCHITECTURE — CONDITIONAL (legacy sub-questions) =====
 
-    ("ARC-C5a", {
+    "ARC-C5a": {
         "text": "Is there a legacy modernisation plan?",
         "category": "architecture", "dimension": "capability",
         "type": TYPE_TOGGLE, "weight": 0.60, "conditional": True,
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("ARC-C5b", {
+        "options": _YES_NO,
+    },
+    "ARC-C5b": {
         "text": "How much of the codebase is legacy?",
         "category": "architecture", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.60, "conditional": True,
@@ -703,8 +710,8 @@ QUESTIONS = OrderedDict([
             {"value": "majority", "label": "Majority (60\u201385%)"},
             {"value": "almost_all", "label": "Almost all (85%+)"},
         ],
-    }),
-    ("ARC-C5c", {
+    },
+    "ARC-C5c": {
         "text": "Is there documentation for legacy components?",
         "category": "architecture", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.60, "conditional": True,
@@ -713,11 +720,11 @@ QUESTIONS = OrderedDict([
             {"value": "partial", "label": "Partial"},
             {"value": "complete", "label": "Complete"},
         ],
-    }),
+    },
 
     # ===== OPS READINESS =====
 
-    ("OPS-C1", {
+    "OPS-C1": {
         "text": "Is there a defined support model (L1/L2/L3, SLAs)?",
         "category": "ops_readiness", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -727,8 +734,8 @@ QUESTIONS = OrderedDict([
             {"value": "defined", "label": "Defined"},
             {"value": "comprehensive", "label": "Comprehensive"},
         ],
-    }),
-    ("OPS-C2", {
+    },
+    "OPS-C2": {
         "text": "Is there an operational readiness testing approach (DR, rollback, backup)?",
         "category": "ops_readiness", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -738,21 +745,21 @@ QUESTIONS = OrderedDict([
             {"value": "planned", "label": "Planned"},
             {"value": "comprehensive", "label": "Comprehensive with rehearsals"},
         ],
-    }),
-    ("OPS-C3", {
+    },
+    "OPS-C3": {
         "text": "Is there a training/handover process?",
         "category": "ops_readiness", "dimension": "capability",
         "type": TYPE_TOGGLE, "weight": 1.00,
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("OPS-O1", {
+        "options": _YES_NO,
+    },
+    "OPS-O1": {
         "text": "Rate documentation completeness (runbooks, support guides)",
         "category": "ops_readiness", "dimension": "capability",
         "type": TYPE_SLIDER, "weight": 1.00,
         "min": 1, "max": 10,
         "labels": {"min": "None", "max": "Comprehensive"},
-    }),
-    ("OPS-O2", {
+    },
+    "OPS-O2": {
         "text": "What are the DR/rollback test results?",
         "category": "ops_readiness", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.15,
@@ -762,11 +769,11 @@ QUESTIONS = OrderedDict([
             {"value": "passed_issues", "label": "Passed with issues"},
             {"value": "clean_pass", "label": "Clean pass"},
         ],
-    }),
+    },
 
     # ===== THIRD PARTY =====
 
-    ("TPT-C1", {
+    "TPT-C1": {
         "text": "Is there a dependency identification/tracking process (SBOM)?",
         "category": "third_party", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -776,8 +783,8 @@ QUESTIONS = OrderedDict([
             {"value": "documented", "label": "Documented"},
             {"value": "automated", "label": "Automated"},
         ],
-    }),
-    ("TPT-C2", {
+    },
+    "TPT-C2": {
         "text": "Do supplier contracts include quality provisions?",
         "category": "third_party", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -787,14 +794,14 @@ QUESTIONS = OrderedDict([
             {"value": "quality_metrics", "label": "Quality metrics"},
             {"value": "incentivised", "label": "Incentivised"},
         ],
-    }),
-    ("TPT-C3", {
+    },
+    "TPT-C3": {
         "text": "Is there a security assessment process for third parties?",
         "category": "third_party", "dimension": "capability",
         "type": TYPE_TOGGLE, "weight": 1.15,
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("TPT-C4", {
+        "options": _YES_NO,
+    },
+    "TPT-C4": {
         "text": "Do suppliers provide test evidence before delivery?",
         "category": "third_party", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -804,32 +811,20 @@ QUESTIONS = OrderedDict([
             {"value": "usually", "label": "Usually"},
             {"value": "always_formal", "label": "Always formal"},
         ],
-    }),
-    ("TPT-O1", {
+    },
+    "TPT-O1": {
         "text": "How many external suppliers or vendors are involved?",
         "category": "third_party", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.00,
-        "options": [
-            {"value": "none", "label": "None"},
-            {"value": "few", "label": "Few (1\u20133)"},
-            {"value": "several", "label": "Several (4\u20138)"},
-            {"value": "many", "label": "Many (9\u201315)"},
-            {"value": "extensive", "label": "Extensive (15+)"},
-        ],
-    }),
-    ("TPT-O2", {
+        "options": _COUNT_BANDS,
+    },
+    "TPT-O2": {
         "text": "How many critical third-party dependencies does the project have?",
         "category": "third_party", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.00,
-        "options": [
-            {"value": "none", "label": "None"},
-            {"value": "few", "label": "Few (1\u20133)"},
-            {"value": "several", "label": "Several (4\u20138)"},
-            {"value": "many", "label": "Many (9\u201315)"},
-            {"value": "extensive", "label": "Extensive (15+)"},
-        ],
-    }),
-    ("TPT-O3", {
+        "options": _COUNT_BANDS,
+    },
+    "TPT-O3": {
         "text": "What proportion of defects originate from third-party suppliers?",
         "category": "third_party", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 1.00,
@@ -841,18 +836,18 @@ QUESTIONS = OrderedDict([
             {"value": "high", "label": "High"},
             {"value": "dominant", "label": "Dominant (most defects)"},
         ],
-    }),
-    ("TPT-O4", {
+    },
+    "TPT-O4": {
         "text": "Rate level of control over integrated systems",
         "category": "third_party", "dimension": "operational",
         "type": TYPE_SLIDER, "weight": 1.00,
         "min": 1, "max": 10, "inverse": True,
         "labels": {"min": "Full control", "max": "No control"},
-    }),
+    },
 
     # ===== DEFECT MANAGEMENT (HOLISTIC) =====
 
-    ("PROPOSED-DFM-01", {
+    "PROPOSED-DFM-01": {
         "text": "How would you describe your defect management process maturity?",
         "category": "defect_management", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.65,
@@ -868,8 +863,8 @@ QUESTIONS = OrderedDict([
             {"value": "formal", "label": "Formal — documented triage with severity definitions and targets"},
             {"value": "optimised", "label": "Optimised — metrics-driven triage with root cause analysis"},
         ],
-    }),
-    ("DFM-C-TARGETS", {
+    },
+    "DFM-C-TARGETS": {
         "text": "Are release defect targets formally defined?",
         "category": "defect_management", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.00, "conditional": True,
@@ -888,11 +883,11 @@ QUESTIONS = OrderedDict([
             {"value": "defined", "label": "Yes — defined targets, informally agreed"},
             {"value": "formal", "label": "Yes — formal targets by severity with sign-off"},
         ],
-    }),
+    },
 
     # ===== TEST PHASE PROGRESS (base capability questions only) =====
 
-    ("TPP-O1", {
+    "TPP-O1": {
         "text": "Which project and test phases are active on this project?",
         "category": "test_phase_progress", "dimension": "operational",
         "type": TYPE_MULTISELECT, "weight": 0.0,
@@ -910,8 +905,8 @@ QUESTIONS = OrderedDict([
             {"value": "release", "label": "Release / Deployment"},
             {"value": "hypercare", "label": "Hypercare / Stabilisation"},
         ],
-    }),
-    ("TPP-C1", {
+    },
+    "TPP-C1": {
         "text": "Are entry and exit criteria defined for each test phase?",
         "category": "test_phase_progress", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.60,
@@ -921,14 +916,14 @@ QUESTIONS = OrderedDict([
             {"value": "all_phases", "label": "Defined for all phases"},
             {"value": "enforced", "label": "Defined and enforced with metrics"},
         ],
-    }),
-    ("TPP-C2", {
+    },
+    "TPP-C2": {
         "text": "Are test blockers formally tracked and escalated?",
         "category": "test_phase_progress", "dimension": "capability",
         "type": TYPE_TOGGLE, "weight": 0.60,
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("TPP-C3", {
+        "options": _YES_NO,
+    },
+    "TPP-C3": {
         "text": "How is phase transition governance handled?",
         "category": "test_phase_progress", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.60,
@@ -938,8 +933,8 @@ QUESTIONS = OrderedDict([
             {"value": "formal", "label": "Formal go/no-go at each gate"},
             {"value": "automated", "label": "Automated gates with metric thresholds"},
         ],
-    }),
-    ("TPP-EC1", {
+    },
+    "TPP-EC1": {
         "text": "Are formal entry/exit criteria defined for each test phase?",
         "category": "test_phase_progress", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.60,
@@ -949,18 +944,18 @@ QUESTIONS = OrderedDict([
             {"value": "defined", "label": "Defined but not enforced"},
             {"value": "enforced", "label": "Defined and enforced"},
         ],
-    }),
+    },
 
     # ===== BRANCH: Life-Safety Regulatory =====
 
-    ("RC-LS-01", {
+    "RC-LS-01": {
         "text": "Is there a formal validation master plan?",
         "category": "life_safety", "dimension": "capability",
         "type": TYPE_TOGGLE, "weight": 1.50, "conditional": True,
         "branch": "life_safety_regulatory",
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("RC-LS-02", {
+        "options": _YES_NO,
+    },
+    "RC-LS-02": {
         "text": "Are design controls (IEC 62304 / FDA design controls) implemented?",
         "category": "life_safety", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.50, "conditional": True,
@@ -971,8 +966,8 @@ QUESTIONS = OrderedDict([
             {"value": "full", "label": "Full"},
             {"value": "certified", "label": "Certified"},
         ],
-    }),
-    ("RC-LS-03", {
+    },
+    "RC-LS-03": {
         "text": "Is there a CAPA (Corrective and Preventive Action) process?",
         "category": "life_safety", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.50, "conditional": True,
@@ -983,8 +978,8 @@ QUESTIONS = OrderedDict([
             {"value": "documented", "label": "Documented"},
             {"value": "integrated", "label": "Integrated"},
         ],
-    }),
-    ("RC-LS-04", {
+    },
+    "RC-LS-04": {
         "text": "Software categorisation (safety class)?",
         "category": "life_safety", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.0, "conditional": True,
@@ -995,18 +990,18 @@ QUESTIONS = OrderedDict([
             {"value": "class_b", "label": "Class B (non-serious)"},
             {"value": "class_c", "label": "Class C (serious/death)"},
         ],
-    }),
-    ("RC-LS-05", {
+    },
+    "RC-LS-05": {
         "text": "Is there 21 CFR Part 11 compliant audit trail?",
         "category": "life_safety", "dimension": "capability",
         "type": TYPE_TOGGLE, "weight": 1.00, "conditional": True,
         "branch": "life_safety_regulatory",
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
+        "options": _YES_NO,
+    },
 
     # ===== BRANCH: Automotive Safety =====
 
-    ("RC-AUTO-01", {
+    "RC-AUTO-01": {
         "text": "What is the highest ASIL for this system?",
         "category": "automotive_safety", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.0, "conditional": True,
@@ -1020,8 +1015,8 @@ QUESTIONS = OrderedDict([
             {"value": "asil_d", "label": "ASIL D (highest)"},
             {"value": "mixed", "label": "Mixed ASILs"},
         ],
-    }),
-    ("RC-AUTO-02", {
+    },
+    "RC-AUTO-02": {
         "text": "Status of the Safety Case / Safety Plan documentation?",
         "category": "automotive_safety", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.50, "conditional": True,
@@ -1033,8 +1028,8 @@ QUESTIONS = OrderedDict([
             {"value": "approved", "label": "Approved and maintained"},
             {"value": "certified", "label": "Externally assessed/certified"},
         ],
-    }),
-    ("RC-AUTO-03", {
+    },
+    "RC-AUTO-03": {
         "text": "What ASPICE capability level is targeted?",
         "category": "automotive_safety", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.60, "conditional": True,
@@ -1045,8 +1040,8 @@ QUESTIONS = OrderedDict([
             {"value": "cl2", "label": "CL2 - Managed"},
             {"value": "cl3", "label": "CL3 - Established"},
         ],
-    }),
-    ("RC-AUTO-04", {
+    },
+    "RC-AUTO-04": {
         "text": "Most recent ASPICE assessment result?",
         "category": "automotive_safety", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 0.0, "conditional": True,
@@ -1059,8 +1054,8 @@ QUESTIONS = OrderedDict([
             {"value": "above_target", "label": "Above target level"},
             {"value": "gaps_identified", "label": "Significant gaps identified"},
         ],
-    }),
-    ("RC-AUTO-05", {
+    },
+    "RC-AUTO-05": {
         "text": "Is there a cybersecurity TARA per ISO/SAE 21434?",
         "category": "automotive_safety", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.00, "conditional": True,
@@ -1071,8 +1066,8 @@ QUESTIONS = OrderedDict([
             {"value": "complete", "label": "Complete TARA documented"},
             {"value": "maintained", "label": "TARA maintained throughout lifecycle"},
         ],
-    }),
-    ("RC-AUTO-06", {
+    },
+    "RC-AUTO-06": {
         "text": "How is open source and third-party software tracked (SBOM)?",
         "category": "automotive_safety", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.60, "conditional": True,
@@ -1083,8 +1078,8 @@ QUESTIONS = OrderedDict([
             {"value": "tooled", "label": "Automated SBOM generation"},
             {"value": "integrated", "label": "Integrated with vulnerability monitoring"},
         ],
-    }),
-    ("RC-AUTO-07", {
+    },
+    "RC-AUTO-07": {
         "text": "Is bidirectional traceability maintained from requirements to test results?",
         "category": "automotive_safety", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 1.00, "conditional": True,
@@ -1096,8 +1091,8 @@ QUESTIONS = OrderedDict([
             {"value": "tooled", "label": "Full bidirectional (tool-supported)"},
             {"value": "verified", "label": "Bidirectional with coverage analysis"},
         ],
-    }),
-    ("RC-AUTO-08", {
+    },
+    "RC-AUTO-08": {
         "text": "Are suppliers required to demonstrate ASPICE compliance?",
         "category": "automotive_safety", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.60, "conditional": True,
@@ -1109,11 +1104,11 @@ QUESTIONS = OrderedDict([
             {"value": "assessed", "label": "Conduct supplier assessments"},
             {"value": "joint", "label": "Joint development with shared processes"},
         ],
-    }),
+    },
 
     # ===== BRANCH: Automation Diagnostics =====
 
-    ("TAM-DX-01", {
+    "TAM-DX-01": {
         "text": "Primary cause of automation instability?",
         "category": "test_assets", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 0.0, "conditional": True,
@@ -1127,8 +1122,8 @@ QUESTIONS = OrderedDict([
             {"value": "external_deps", "label": "External dependencies"},
             {"value": "architecture", "label": "Architecture"},
         ],
-    }),
-    ("TAM-DX-02", {
+    },
+    "TAM-DX-02": {
         "text": "How long has automation been in troubled state?",
         "category": "test_assets", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 0.60, "conditional": True,
@@ -1140,15 +1135,15 @@ QUESTIONS = OrderedDict([
             {"value": "6_to_12_months", "label": "6-12 months"},
             {"value": "over_1_year", "label": "Over 1 year"},
         ],
-    }),
-    ("TAM-DX-03", {
+    },
+    "TAM-DX-03": {
         "text": "Has there been a previous remediation attempt?",
         "category": "test_assets", "dimension": "operational",
         "type": TYPE_TOGGLE, "weight": 0.60, "conditional": True,
         "branch": "automation_diagnostics",
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("TAM-DX-04", {
+        "options": _YES_NO,
+    },
+    "TAM-DX-04": {
         "text": "What proportion of test failures are properly investigated (vs dismissed as flaky)?",
         "category": "test_assets", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 0.60, "conditional": True,
@@ -1160,8 +1155,8 @@ QUESTIONS = OrderedDict([
             {"value": "most", "label": "Most"},
             {"value": "all", "label": "All or nearly all"},
         ],
-    }),
-    ("TAM-DX-05", {
+    },
+    "TAM-DX-05": {
         "text": "Is there pressure to 'just make tests green'?",
         "category": "test_assets", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 0.60, "conditional": True,
@@ -1173,8 +1168,8 @@ QUESTIONS = OrderedDict([
             {"value": "significant", "label": "Significant"},
             {"value": "overwhelming", "label": "Overwhelming"},
         ],
-    }),
-    ("TAM-DX-06", {
+    },
+    "TAM-DX-06": {
         "text": "Would starting fresh be considered?",
         "category": "test_assets", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 0.0, "conditional": True,
@@ -1186,11 +1181,11 @@ QUESTIONS = OrderedDict([
             {"value": "under_consideration", "label": "Under consideration"},
             {"value": "preferred", "label": "Preferred"},
         ],
-    }),
+    },
 
     # ===== BRANCH: Enterprise Scale Operations =====
 
-    ("SC-ENT-01", {
+    "SC-ENT-01": {
         "text": "Is there a follow-the-sun support model?",
         "category": "enterprise_scale", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 0.60, "conditional": True,
@@ -1201,15 +1196,15 @@ QUESTIONS = OrderedDict([
             {"value": "partial", "label": "Partial coverage"},
             {"value": "full_24_7", "label": "Full 24/7"},
         ],
-    }),
-    ("SC-ENT-02", {
+    },
+    "SC-ENT-02": {
         "text": "Are there regional data residency requirements?",
         "category": "enterprise_scale", "dimension": "capability",
         "type": TYPE_TOGGLE, "weight": 0.60, "conditional": True,
         "branch": "enterprise_scale_ops",
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("SC-ENT-03", {
+        "options": _YES_NO,
+    },
+    "SC-ENT-03": {
         "text": "Multi-region deployment architecture?",
         "category": "enterprise_scale", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.0, "conditional": True,
@@ -1221,8 +1216,8 @@ QUESTIONS = OrderedDict([
             {"value": "active_active", "label": "Active-active"},
             {"value": "geo_distributed", "label": "Geo-distributed"},
         ],
-    }),
-    ("SC-ENT-04", {
+    },
+    "SC-ENT-04": {
         "text": "Release coordination across regions?",
         "category": "enterprise_scale", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 0.0, "conditional": True,
@@ -1234,18 +1229,18 @@ QUESTIONS = OrderedDict([
             {"value": "feature_flags", "label": "Feature flags"},
             {"value": "independent", "label": "Independent"},
         ],
-    }),
-    ("SC-ENT-05", {
+    },
+    "SC-ENT-05": {
         "text": "Regional compliance variations tracked?",
         "category": "enterprise_scale", "dimension": "capability",
         "type": TYPE_TOGGLE, "weight": 0.60, "conditional": True,
         "branch": "enterprise_scale_ops",
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
+        "options": _YES_NO,
+    },
 
     # ===== BRANCH: Legacy System Complexity =====
 
-    ("ARC-LG-01", {
+    "ARC-LG-01": {
         "text": "Legacy system role in project?",
         "category": "architecture", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.60, "conditional": True,
@@ -1257,15 +1252,15 @@ QUESTIONS = OrderedDict([
             {"value": "being_extended", "label": "Being extended"},
             {"value": "core_dependency", "label": "Core dependency"},
         ],
-    }),
-    ("ARC-LG-02", {
+    },
+    "ARC-LG-02": {
         "text": "Legacy system documentation quality?",
         "category": "architecture", "dimension": "capability",
         "type": TYPE_SLIDER, "weight": 0.60, "conditional": True,
         "branch": "legacy_complexity",
         "min": 1, "max": 10, "unit": "/10",
-    }),
-    ("ARC-LG-03", {
+    },
+    "ARC-LG-03": {
         "text": "Access to legacy system expertise?",
         "category": "architecture", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.60, "conditional": True,
@@ -1276,8 +1271,8 @@ QUESTIONS = OrderedDict([
             {"value": "constrained", "label": "Available but constrained"},
             {"value": "readily_available", "label": "Readily available"},
         ],
-    }),
-    ("ARC-LG-04", {
+    },
+    "ARC-LG-04": {
         "text": "Legacy system test coverage?",
         "category": "architecture", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.60, "conditional": True,
@@ -1288,18 +1283,18 @@ QUESTIONS = OrderedDict([
             {"value": "partial", "label": "Partial"},
             {"value": "comprehensive", "label": "Comprehensive"},
         ],
-    }),
+    },
 
     # ===== BRANCH: Supplier Quality Deep-Dive =====
 
-    ("TPT-SQ-01", {
+    "TPT-SQ-01": {
         "text": "Is there a supplier quality scorecard?",
         "category": "third_party", "dimension": "operational",
         "type": TYPE_TOGGLE, "weight": 0.60, "conditional": True,
         "branch": "supplier_quality",
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("TPT-SQ-02", {
+        "options": _YES_NO,
+    },
+    "TPT-SQ-02": {
         "text": "Supplier integration testing approach?",
         "category": "third_party", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 0.60, "conditional": True,
@@ -1310,15 +1305,15 @@ QUESTIONS = OrderedDict([
             {"value": "defined", "label": "Defined"},
             {"value": "contractual", "label": "Contractual requirement"},
         ],
-    }),
-    ("TPT-SQ-03", {
+    },
+    "TPT-SQ-03": {
         "text": "Defect attribution to specific suppliers tracked?",
         "category": "third_party", "dimension": "operational",
         "type": TYPE_TOGGLE, "weight": 0.60, "conditional": True,
         "branch": "supplier_quality",
-        "options": [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}],
-    }),
-    ("TPT-SQ-04", {
+        "options": _YES_NO,
+    },
+    "TPT-SQ-04": {
         "text": "Remedies exercised for poor supplier quality?",
         "category": "third_party", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 0.60, "conditional": True,
@@ -1329,11 +1324,11 @@ QUESTIONS = OrderedDict([
             {"value": "formal", "label": "Formal process"},
             {"value": "penalties", "label": "Contract penalties applied"},
         ],
-    }),
+    },
 
     # ===== BRANCH: Governance Authority Gap =====
 
-    ("GOV-AG-01", {
+    "GOV-AG-01": {
         "text": "Why does test lead lack release authority?",
         "category": "governance", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.0, "conditional": True,
@@ -1345,8 +1340,8 @@ QUESTIONS = OrderedDict([
             {"value": "not_requested", "label": "Not requested"},
             {"value": "previously_lost", "label": "Previously had but lost"},
         ],
-    }),
-    ("GOV-AG-02", {
+    },
+    "GOV-AG-02": {
         "text": "Has quality been overridden to meet deadlines?",
         "category": "governance", "dimension": "operational",
         "type": TYPE_SELECT, "weight": 0.60, "conditional": True,
@@ -1358,8 +1353,8 @@ QUESTIONS = OrderedDict([
             {"value": "sometimes", "label": "Sometimes"},
             {"value": "frequently", "label": "Frequently"},
         ],
-    }),
-    ("GOV-AG-03", {
+    },
+    "GOV-AG-03": {
         "text": "Is there executive sponsorship for quality?",
         "category": "governance", "dimension": "capability",
         "type": TYPE_SELECT, "weight": 0.60, "conditional": True,
@@ -1370,128 +1365,155 @@ QUESTIONS = OrderedDict([
             {"value": "active", "label": "Active"},
             {"value": "strategic", "label": "Quality is strategic priority"},
         ],
-    }),
-])
+    },
+}
+
+# Freeze the table once built: option lists become tuples and the outer
+# mapping is read-only, so indexes derived from it at import stay valid.
+# Per-question dicts stay plain dicts for JSON serialisation by the API.
+for _q in QUESTIONS.values():
+    if "options" in _q:
+        _q["options"] = tuple(_q["options"])
+del _q
+QUESTIONS = MappingProxyType(QUESTIONS)
+
+
+# Branch question groups, shared by CATEGORIES and SECOND_LEVEL_BRANCHES
+_GOV_AG = ("GOV-AG-01", "GOV-AG-02", "GOV-AG-03")
+_TAM_DX = ("TAM-DX-01", "TAM-DX-02", "TAM-DX-03",
+           "TAM-DX-04", "TAM-DX-05", "TAM-DX-06")
+_ARC_LG = ("ARC-LG-01", "ARC-LG-02", "ARC-LG-03", "ARC-LG-04")
+_TPT_SQ = ("TPT-SQ-01", "TPT-SQ-02", "TPT-SQ-03", "TPT-SQ-04")
+_RC_LS = ("RC-LS-01", "RC-LS-02", "RC-LS-03", "RC-LS-04", "RC-LS-05")
+_RC_AUTO = ("RC-AUTO-01", "RC-AUTO-02", "RC-AUTO-03", "RC-AUTO-04",
+            "RC-AUTO-05", "RC-AUTO-06", "RC-AUTO-07", "RC-AUTO-08")
+_SC_ENT = ("SC-ENT-01", "SC-ENT-02", "SC-ENT-03", "SC-ENT-04", "SC-ENT-05")
 
 
 # ---------------------------------------------------------------------------
 # CATEGORIES — ordered assessment structure
 # ---------------------------------------------------------------------------
 
-CATEGORIES = OrderedDict([
-    ("governance", {
+CATEGORIES: dict[str, dict] = {
+    "governance": {
         "name": "Governance",
         "description": "Test leadership, authority, and oversight",
         "capability_questions": ["GOV-C1", "GOV-C2", "GOV-C3", "GOV-C4"],
         "operational_questions": ["GOV-O1", "GOV-O2", "GOV-O3", "GOV-O4", "GOV-O5"],
-        "branch_questions": ["GOV-AG-01", "GOV-AG-02", "GOV-AG-03"],
-    }),
-    ("test_strategy", {
+        "branch_questions": _GOV_AG,
+    },
+    "test_strategy": {
         "name": "Test Strategy",
         "description": "Test approach, coverage, and design",
         "capability_questions": ["TST-C1", "TST-C2", "TST-C3", "TST-C4"],
         "operational_questions": ["TST-O1", "TST-O2", "TST-O3", "TST-O4", "TST-O5"],
-    }),
-    ("test_assets", {
+    },
+    "test_assets": {
         "name": "Test Assets",
         "description": "Test automation and asset management",
         "capability_questions": ["TAM-C1", "TAM-C2", "TAM-C3"],
         "operational_questions": ["TAM-O1", "TAM-O2", "TAM-O3", "TAM-O4"],
-        "branch_questions": ["TAM-DX-01", "TAM-DX-02", "TAM-DX-03",
-                             "TAM-DX-04", "TAM-DX-05", "TAM-DX-06"],
-    }),
-    ("development", {
+        "branch_questions": _TAM_DX,
+    },
+    "development": {
         "name": "Development Practices",
         "description": "Code quality, reviews, and build practices",
         "capability_questions": ["DEV-C1", "DEV-C2", "DEV-C3", "DEV-C4"],
         "operational_questions": ["DEV-O1", "DEV-O2", "DEV-O3"],
-    }),
-    ("environment", {
+    },
+    "environment": {
         "name": "Environment",
         "description": "Test environments, CI/CD, and infrastructure",
         "capability_questions": ["ENV-C1", "ENV-C2", "ENV-C3"],
         "operational_questions": ["ENV-O1", "ENV-O2", "ENV-O3", "ENV-O4", "ENV-O5"],
-    }),
-    ("requirements", {
+    },
+    "requirements": {
         "name": "Requirements",
         "description": "Requirements quality and traceability",
         "capability_questions": ["REQ-C1", "REQ-C2", "REQ-C3"],
         "operational_questions": ["REQ-O1", "REQ-O2"],
-    }),
-    ("change_management", {
+    },
+    "change_management": {
         "name": "Change Management",
         "description": "Change control and release management",
         "capability_questions": ["CHG-C1", "CHG-C2", "CHG-C3"],
         "operational_questions": ["CHG-O1", "CHG-O2"],
-    }),
-    ("feedback", {
+    },
+    "feedback": {
         "name": "Feedback & Metrics",
         "description": "Defect tracking and quality metrics",
         "capability_questions": ["FBK-C1"],
         "operational_questions": ["FBK-O1", "FBK-O2"],
-    }),
-    ("defect_management", {
+    },
+    "defect_management": {
         "name": "Defect Management",
         "description": "Defect triage, tracking, and release targets",
         "capability_questions": ["PROPOSED-DFM-01"],
         "operational_questions": [],
         "conditional_questions": ["DFM-C-TARGETS"],
-    }),
-    ("architecture", {
+    },
+    "architecture": {
         "name": "Architecture",
         "description": "System architecture and testability",
         "capability_questions": ["ARC-C1", "ARC-C2", "ARC-C3", "ARC-C4", "ARC-C5"],
         "operational_questions": ["ARC-O1", "ARC-O2"],
         "conditional_questions": ["ARC-C5a", "ARC-C5b", "ARC-C5c"],
-        "branch_questions": ["ARC-LG-01", "ARC-LG-02", "ARC-LG-03", "ARC-LG-04"],
-    }),
-    ("ops_readiness", {
+        "branch_questions": _ARC_LG,
+    },
+    "ops_readiness": {
         "name": "Ops Readiness",
         "description": "Operational readiness and support",
         "capability_questions": ["OPS-C1", "OPS-C2", "OPS-C3"],
         "operational_questions": ["OPS-O1", "OPS-O2"],
-    }),
-    ("third_party", {
+    },
+    "third_party": {
         "name": "Third Party",
         "description": "Vendor and supplier management",
         "capability_questions": ["TPT-C1", "TPT-C2", "TPT-C3", "TPT-C4"],
         "operational_questions": ["TPT-O1", "TPT-O2", "TPT-O3", "TPT-O4"],
-        "branch_questions": ["TPT-SQ-01", "TPT-SQ-02", "TPT-SQ-03", "TPT-SQ-04"],
-    }),
-    ("test_phase_progress", {
+        "branch_questions": _TPT_SQ,
+    },
+    "test_phase_progress": {
         "name": "Test Phase Progress",
         "description": "Active test phases, criteria, and governance",
         "capability_questions": ["TPP-O1", "TPP-C1", "TPP-C2", "TPP-C3", "TPP-EC1"],
         "operational_questions": [],
-    }),
+    },
     # Branch-only categories (appear when triggered by context/answers)
-    ("life_safety", {
+    "life_safety": {
         "name": "Life-Safety Compliance",
         "description": "FDA, HIPAA, and medical device regulatory compliance",
         "capability_questions": [],
         "operational_questions": [],
-        "branch_questions": ["RC-LS-01", "RC-LS-02", "RC-LS-03", "RC-LS-04", "RC-LS-05"],
+        "branch_questions": _RC_LS,
         "branch_only": True,
-    }),
-    ("automotive_safety", {
+    },
+    "automotive_safety": {
         "name": "Automotive Safety & Compliance",
         "description": "ISO 26262, ASPICE, cybersecurity (ISO 21434), and supply chain",
         "capability_questions": [],
         "operational_questions": [],
-        "branch_questions": ["RC-AUTO-01", "RC-AUTO-02", "RC-AUTO-03", "RC-AUTO-04",
-                             "RC-AUTO-05", "RC-AUTO-06", "RC-AUTO-07", "RC-AUTO-08"],
+        "branch_questions": _RC_AUTO,
         "branch_only": True,
-    }),
-    ("enterprise_scale", {
+    },
+    "enterprise_scale": {
         "name": "Enterprise Scale Operations",
         "description": "Multi-region deployment, data residency, and global coordination",
         "capability_questions": [],
         "operational_questions": [],
-        "branch_questions": ["SC-ENT-01", "SC-ENT-02", "SC-ENT-03",
-                             "SC-ENT-04", "SC-ENT-05"],
+        "branch_questions": _SC_ENT,
         "branch_only": True,
-    }),
-])
+    },
+}
+
+# Frozen like QUESTIONS: question lists become tuples, the registry read-only
+for _cat in CATEGORIES.values():
+    for _qlist in ("capability_questions", "operational_questions",
+                   "conditional_questions", "branch_questions"):
+        if _qlist in _cat:
+            _cat[_qlist] = tuple(_cat[_qlist])
+del _cat, _qlist
+CATEGORIES = MappingProxyType(CATEGORIES)
 
 
 # ---------------------------------------------------------------------------
@@ -1616,7 +1638,7 @@ SECOND_LEVEL_BRANCHES = [
                 "value": ["fda", "hipaa", "iso_13485"],
             }],
         },
-        "add": ["RC-LS-01", "RC-LS-02", "RC-LS-03", "RC-LS-04", "RC-LS-05"],
+        "add": _RC_LS,
     },
     {
         "id": "SLB-002",
@@ -1629,8 +1651,7 @@ SECOND_LEVEL_BRANCHES = [
                 "value": ["struggling", "failing"],
             }],
         },
-        "add": ["TAM-DX-01", "TAM-DX-02", "TAM-DX-03",
-                "TAM-DX-04", "TAM-DX-05", "TAM-DX-06"],
+        "add": _TAM_DX,
     },
     {
         "id": "SLB-003",
@@ -1643,7 +1664,7 @@ SECOND_LEVEL_BRANCHES = [
                  "value": ["multinational", "global"]},
             ],
         },
-        "add": ["SC-ENT-01", "SC-ENT-02", "SC-ENT-03", "SC-ENT-04", "SC-ENT-05"],
+        "add": _SC_ENT,
     },
     {
         "id": "SLB-004",
@@ -1656,7 +1677,7 @@ SECOND_LEVEL_BRANCHES = [
                 {"question_id": "ARC-C5c", "operator": "equals", "value": "none"},
             ],
         },
-        "add": ["ARC-LG-01", "ARC-LG-02", "ARC-LG-03", "ARC-LG-04"],
+        "add": _ARC_LG,
     },
     {
         "id": "SLB-005",
@@ -1670,7 +1691,7 @@ SECOND_LEVEL_BRANCHES = [
                  "value": ["moderate", "high", "dominant"]},
             ],
         },
-        "add": ["TPT-SQ-01", "TPT-SQ-02", "TPT-SQ-03", "TPT-SQ-04"],
+        "add": _TPT_SQ,
     },
     {
         "id": "SLB-006",
@@ -1683,7 +1704,7 @@ SECOND_LEVEL_BRANCHES = [
                  "value": ["no", "escalate_only"]},
             ],
         },
-        "add": ["GOV-AG-01", "GOV-AG-02", "GOV-AG-03"],
+        "add": _GOV_AG,
     },
     {
         "id": "SLB-007",
@@ -1696,8 +1717,7 @@ SECOND_LEVEL_BRANCHES = [
                 "value": ["iso_26262", "aspice", "iso_21434", "autosar"],
             }],
         },
-        "add": ["RC-AUTO-01", "RC-AUTO-02", "RC-AUTO-03", "RC-AUTO-04",
-                "RC-AUTO-05", "RC-AUTO-06", "RC-AUTO-07", "RC-AUTO-08"],
+        "add": _RC_AUTO,
     },
 ]
 
@@ -1799,6 +1819,20 @@ CONTEXT_FILTERS = [
     },
 ]
 
+# Rule question lists are only used as sets; freeze them once here
+for _dep in CATEGORY_DEPENDENCIES + SECOND_LEVEL_BRANCHES:
+    for _key in ("skip", "add"):
+        if _key in _dep:
+            _dep[_key] = frozenset(_dep[_key])
+for _pd in PROGRESSIVE_DISCLOSURE:
+    for _stage in _pd["stages"]:
+        if "questions" in _stage:
+            _stage["questions"] = frozenset(_stage["questions"])
+for _cf in CONTEXT_FILTERS:
+    if "keep_only" in _cf:
+        _cf["keep_only"]["questions"] = frozenset(_cf["keep_only"]["questions"])
+del _dep, _key, _pd, _stage, _cf
+
 
 # ---------------------------------------------------------------------------
 # PHASE WEIGHTS — capability vs operational emphasis by project phase
@@ -2456,3 +2490,6 @@ QUESTION_HELP: dict[str, str] = {
         "backing to push back against schedule pressure."
     ),
 }
+
+# Read-only like QUESTIONS and CATEGORIES; served as-is by the API
+QUESTION_HELP = MappingProxyType(QUESTION_HELP)
@@ -17,7 +17,7 @@ These map directly to the Cap/Ops axes on the viability heatmap.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable, Collection
 
 from lib.mira_questions import (
     QUESTIONS,
@@ -25,6 +25,7 @@ from lib.mira_questions import (
     CATEGORY_DEPENDENCIES,
     SECOND_LEVEL_BRANCHES,
     PROGRESSIVE_DISCLOSURE,
+    CONTEXT_FILTERS,
     PHASE_WEIGHTS,
     CONTEXT_MODIFIERS,
     TYPE_TOGGLE,
@@ -41,100 +42,189 @@ from lib.mira_questions import (
 
 
 # ---------------------------------------------------------------------------
-# Answer normalisation — any answer → 0-100%
+# Scoring lookup tables — built once from QUESTIONS at import
 # ---------------------------------------------------------------------------
+# Each scored question maps to (kind, data):
+#   _TOGGLE:  True=100%, anything else 0%
+#   _ORDINAL: {option value: score} for ascending/descending selects
+#   _GAP:     {option value: 100 - gap} for gap-scored selects
+#   _CUSTOM:  {option value: score} from value_scores (unknown answers score 0)
+#   _LINEAR:  (min, max - min, inverse) for sliders/numbers
+# Unscored, multiselect and option-less select questions have no entry.
+
+_TOGGLE, _ORDINAL, _GAP, _CUSTOM, _LINEAR = range(5)
+
+
+def _build_score_luts() -> dict[str, tuple[int, Any]]:
+    """Precompute the answer → 0-100% mapping for every scored question."""
+    luts = {}
+    for qid, q in QUESTIONS.items():
+        scoring = q.get("scoring_order", ASCENDING)
+        if scoring == UNSCORED:
+            continue
+        qtype = q["type"]
 
-def normalise_answer(question_id: str, answer: Any) -> float | None:
-    """Convert a raw answer to a 0-100% maturity score.
-
-    Returns None for unscored questions or missing answers.
-    """
-    if answer is None:
-        return None
-
-    q = QUESTIONS.get(question_id)
-    if q is None:
-        return None
+        if qtype == TYPE_TOGGLE:
+            luts[qid] = (_TOGGLE, None)
 
-    scoring = q.get("scoring_order", ASCENDING)
-    if scoring == UNSCORED:
-        return None
+        elif qtype == TYPE_SELECT:
+            options = q.get("options", [])
+            if not options:
+                continue
+            if scoring == GAP:
+                luts[qid] = (_GAP, {
+                    value: 100.0 - gap  # Gap of 0 = 100% maturity
+                    for value, gap in q.get("gap_scoring", {}).items()
+                    if gap is not None
+                })
+            elif scoring == CUSTOM:
+                luts[qid] = (_CUSTOM, {
+                    value: float(score)
+                    for value, score in q.get("value_scores", {}).items()
+                })
+            else:
+                n = len(options)
+                scores = {}
+                for idx, opt in enumerate(options):
+                    if n == 1:
+                        score = 100.0
+                    elif scoring == DESCENDING:
+                        # First option = best (100%), last = worst (0%)
+                        score = 100.0 * (1.0 - idx / (n - 1))
+                    else:
+                        # Ascending (default): first = worst (0%), last = best (100%)
+                        score = 100.0 * idx / (n - 1)
+                    # First occurrence wins, as with list.index()
+                    scores.setdefault(opt["value"], score)
+                luts[qid] = (_ORDINAL, scores)
+
+        elif qtype in (TYPE_SLIDER, TYPE_NUMBER):
+            qmin = float(q.get("min", 0))
+            qmax = float(q.get("max", 100))
+            luts[qid] = (_LINEAR, (qmin, qmax - qmin, q.get("inverse", False)))
+
+    return luts
+
+
+_SCORE_LUTS = _build_score_luts()
 
-    qtype = q["type"]
 
-    # Toggle: True=100%, False=0%
-    if qtype == TYPE_TOGGLE:
-        return 100.0 if answer is True else 0.0
+# ---------------------------------------------------------------------------
+# Question indexes — built once from CATEGORIES / QUESTIONS at import
+# ---------------------------------------------------------------------------
 
-    # Select: ordinal position or custom scoring
-    if qtype == TYPE_SELECT:
-        return _normalise_select(q, answer, scoring)
+_QUESTION_LISTS = ("capability_questions", "operational_questions",
+                   "conditional_questions", "branch_questions")
+
+# Every question in each category, in display order
+_CATEGORY_QUESTIONS: dict[str, tuple[str, ...]] = {
+    cat_id: tuple(qid for qlist in _QUESTION_LISTS for qid in cat.get(qlist, []))
+    for cat_id, cat in CATEGORIES.items()
+}
+
+# Questions shown before any rule fires: capability and operational lists
+# of every category that is not branch-only
+_BASE_QUESTIONS: tuple[str, ...] = tuple(
+    qid
+    for cat in CATEGORIES.values() if not cat.get("branch_only")
+    for qlist in ("capability_questions", "operational_questions")
+    for qid in cat.get(qlist, [])
+)
 
-    # Slider / Number: linear normalisation
-    if qtype in (TYPE_SLIDER, TYPE_NUMBER):
-        return _normalise_slider(q, answer)
+# Categories with their own progressive disclosure rule (exempt from PD-001)
+_PD_SCOPED_CATEGORIES: frozenset[str] = frozenset(
+    pd.get("scope") for pd in PROGRESSIVE_DISCLOSURE
+)
 
-    # Multiselect: not scored (used for filtering only)
-    if qtype == TYPE_MULTISELECT:
-        return None
+# Display order across all categories (each question once), so ordering a
+# visible set is a single filtered pass
+_QUESTION_ORDER: tuple[str, ...] = tuple(dict.fromkeys(
+    qid for cat_qs in _CATEGORY_QUESTIONS.values() for qid in cat_qs
+))
+
+
+def _group_by_dimension() -> dict[str, frozenset[str]]:
+    """Question IDs per dimension ("capability" / "operational")."""
+    groups: dict[str, set[str]] = {}
+    for qid, q in QUESTIONS.items():
+        groups.setdefault(q.get("dimension"), set()).add(qid)
+    return {dim: frozenset(qids) for dim, qids in groups.items()}
+
+
+_DIMENSION_QUESTIONS = _group_by_dimension()
+
+_QUESTION_WEIGHTS: dict[str, float] = {
+    qid: q.get("weight", 1.0) for qid, q in QUESTIONS.items()
+}
+
+# Weighted questions per category as (qid, is_capability, weight), so the
+# scoring loop does no QUESTIONS lookups; zero-weight and dimensionless
+# questions never contribute and are left out
+_CATEGORY_WEIGHTS: dict[str, tuple[tuple[str, bool, float], ...]] = {
+    cat_id: tuple(
+        (qid, QUESTIONS[qid]["dimension"] == "capability", QUESTIONS[qid].get("weight", 1.0))
+        for qid in cat_qs
+        if qid in QUESTIONS
+        and QUESTIONS[qid].get("weight", 1.0) > 0
+        and QUESTIONS[qid].get("dimension") in ("capability", "operational")
+    )
+    for cat_id, cat_qs in _CATEGORY_QUESTIONS.items()
+}
 
-    return None
 
+# ---------------------------------------------------------------------------
+# Answer normalisation — any answer → 0-100%
+# ---------------------------------------------------------------------------
 
-def _normalise_select(q: dict, answer: Any, scoring: str) -> float | None:
-    """Normalise a select-type answer."""
-    options = q.get("options", [])
-    if not options:
-        return None
+def normalise_answer(question_id: str, answer: Any) -> float | None:
+    """Convert a raw answer to a 0-100% maturity score.
 
-    # Gap scoring (PROPOSED-DFM-* questions)
-    if scoring == GAP:
-        gap_scores = q.get("gap_scoring", {})
-        gap = gap_scores.get(answer)
-        if gap is not None:
-            return 100.0 - gap  # Gap of 0 = 100% maturity
+    Returns None for unscored questions or missing answers.
+    """
+    if answer is None:
         return None
 
-    # Custom value_scores
-    if scoring == CUSTOM:
-        value_scores = q.get("value_scores", {})
-        return float(value_scores.get(answer, 0))
-
-    # Find position in options list
-    values = [opt["value"] for opt in options]
-    if answer not in values:
+    lut = _SCORE_LUTS.get(question_id)
+    if lut is None:
         return None
-    idx = values.index(answer)
-    n = len(values)
-
-    if n == 1:
-        return 100.0
-
-    if scoring == DESCENDING:
-        # First option = best (100%), last = worst (0%)
-        return 100.0 * (1.0 - idx / (n - 1))
-    else:
-        # Ascending (default): first = worst (0%), last = best (100%)
-        return 100.0 * idx / (n - 1)
+    kind, data = lut
 
+    # Toggle: True=100%, False=0%
+    if kind == _TOGGLE:
+        return 100.0 if answer is True else 0.0
 
-def _normalise_slider(q: dict, answer: Any) -> float | None:
-    """Normalise a slider/number answer."""
+    # Slider / Number: linear normalisation
+    if kind == _LINEAR:
+        return _normalise_slider(data, answer)
+
+    # Select: ordinal position, gap or custom scoring
+    if kind == _ORDINAL:
+        try:
+            return data.get(answer)
+        except TypeError:  # Unhashable answer can't be one of the options
+            return None
+    if kind == _GAP:
+        return data.get(answer)
+    return data.get(answer, 0.0)
+
+
+def _normalise_slider(
+    bounds: tuple[float, float, bool], answer: Any
+) -> float | None:
+    """Normalise a slider/number answer against precomputed bounds."""
     try:
         val = float(answer)
     except (TypeError, ValueError):
         return None
 
-    qmin = float(q.get("min", 0))
-    qmax = float(q.get("max", 100))
-
-    if qmax == qmin:
+    qmin, span, inverse = bounds
+    if span == 0:
         return 100.0
 
-    pct = (val - qmin) / (qmax - qmin) * 100.0
+    pct = (val - qmin) / span * 100.0
     pct = max(0.0, min(100.0, pct))
 
-    if q.get("inverse", False):
+    if inverse:
         pct = 100.0 - pct
 
     return pct
@@ -163,28 +253,23 @@ def get_visible_questions(
     context = context or {}
 
     # Start with all base questions from categories (not branch-only)
-    visible = set()
-    for cat_id, cat in CATEGORIES.items():
-        if cat.get("branch_only"):
-            continue
-        for qlist in ("capability_questions", "operational_questions"):
-            visible.update(cat.get(qlist, []))
+    visible = set(_BASE_QUESTIONS)
 
     # Apply category dependencies
     skip_set = set()
     add_set = set()
-    for dep in CATEGORY_DEPENDENCIES:
-        if _evaluate_trigger(dep["trigger"], answers, context):
-            skip_set.update(dep.get("skip", []))
-            add_set.update(dep.get("add", []))
+    for triggered, skip, add in _DEPENDENCY_RULES:
+        if triggered(answers, context):
+            skip_set.update(skip)
+            add_set.update(add)
 
     visible -= skip_set
     visible |= add_set
 
     # Apply second-level branches
-    for branch in SECOND_LEVEL_BRANCHES:
-        if _evaluate_branch_trigger(branch["trigger"], answers, context):
-            visible.update(branch.get("add", []))
+    for triggered, add in _BRANCH_RULES:
+        if triggered(answers, context):
+            visible.update(add)
 
     # Apply context filters
     visible = _apply_context_filters(visible, context)
@@ -196,128 +281,157 @@ def get_visible_questions(
     return _order_questions(visible)
 
 
-def _evaluate_trigger(
-    trigger: dict, answers: dict, context: dict
-) -> bool:
-    """Evaluate a single trigger condition."""
-    # Question-based trigger
-    if "question_id" in trigger:
-        qid = trigger["question_id"]
-        val = answers.get(qid)
-        if val is None:
-            return False
-        return _compare(val, trigger["operator"], trigger["value"])
-
-    # Context-based trigger
-    if "context_field" in trigger:
-        field = trigger["context_field"]
-        val = context.get(field)
-        if val is None:
-            return False
-        return _compare(val, trigger["operator"], trigger["value"])
+def _contains_any(actual: Any, expected: Any) -> bool:
+    # actual is a list, expected is a list — any overlap
+    if isinstance(actual, (list, tuple)):
+        return bool(set(actual) & set(expected))
+    return actual in expected
 
-    return False
 
+def _not_contains(actual: Any, expected: Any) -> bool:
+    if isinstance(actual, (list, tuple)):
+        return expected not in actual
+    return actual != expected
 
-def _evaluate_branch_trigger(
-    trigger: dict, answers: dict, context: dict
-) -> bool:
-    """Evaluate compound branch trigger (all conditions must be true)."""
-    conditions = trigger.get("conditions", [])
-    if not conditions:
-        return False
-
-    for cond in conditions:
-        if "question_id" in cond:
-            val = answers.get(cond["question_id"])
-            if val is None:
-                return False
-            if not _compare(val, cond["operator"], cond["value"]):
-                return False
-        elif "context_field" in cond:
-            val = context.get(cond["context_field"])
-            if val is None:
-                return False
-            if not _compare(val, cond["operator"], cond["value"]):
-                return False
-        else:
-            return False
 
-    return True
+# Trigger operator → comparison(actual, expected)
+_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "equals": lambda actual, expected: actual == expected,
+    "not_equals": lambda actual, expected: actual != expected,
+    "in": lambda actual, expected: actual in expected,
+    "not_in": lambda actual, expected: actual not in expected,
+    "contains_any": _contains_any,
+    "not_contains": _not_contains,
+    "gt": lambda actual, expected: float(actual) > float(expected),
+    "greater_than": lambda actual, expected: float(actual) > float(expected),
+    "gte": lambda actual, expected: float(actual) >= float(expected),
+    "greater_than_or_equal": lambda actual, expected: float(actual) >= float(expected),
+    "lt": lambda actual, expected: float(actual) < float(expected),
+    "less_than": lambda actual, expected: float(actual) < float(expected),
+    "lte": lambda actual, expected: float(actual) <= float(expected),
+    "less_than_or_equal": lambda actual, expected: float(actual) <= float(expected),
+}
+
+
+def _never(actual: Any, expected: Any) -> bool:
+    return False
 
 
 def _compare(actual: Any, operator: str, expected: Any) -> bool:
-    """Compare a value against a trigger condition."""
-    if operator == "equals":
-        return actual == expected
-    if operator == "not_equals":
-        return actual != expected
-    if operator == "in":
-        return actual in expected
-    if operator == "not_in":
-        return actual not in expected
-    if operator == "contains_any":
-        # actual is a list, expected is a list — any overlap
+    """Compare a value against a trigger condition (unknown operators fail)."""
+    return _OPERATORS.get(operator, _never)(actual, expected)
+
+
+# ---------------------------------------------------------------------------
+# Compiled rule triggers — built once from the rule tables at import
+# ---------------------------------------------------------------------------
+
+_Predicate = Callable[[dict, dict], bool]
+
+
+def _contains_any_of(expected: Any) -> Callable[[Any, Any], bool]:
+    """contains_any with the expected values hashed once, not per call."""
+    expected_set = frozenset(expected)
+
+    def compare(actual: Any, _expected: Any) -> bool:
         if isinstance(actual, (list, tuple)):
-            return bool(set(actual) & set(expected))
+            return not expected_set.isdisjoint(actual)
         return actual in expected
-    if operator == "not_contains":
-        if isinstance(actual, (list, tuple)):
-            return expected not in actual
-        return actual != expected
-    if operator in ("gt", "greater_than"):
-        return float(actual) > float(expected)
-    if operator in ("gte", "greater_than_or_equal"):
-        return float(actual) >= float(expected)
-    if operator in ("lt", "less_than"):
-        return float(actual) < float(expected)
-    if operator in ("lte", "less_than_or_equal"):
-        return float(actual) <= float(expected)
-    return False
+    return compare
+
+
+def _compile_condition(cond: dict) -> _Predicate:
+    """Bind a question or context condition to a predicate(answers, context)."""
+    compare = _OPERATORS.get(cond.get("operator"), _never)
+    expected = cond.get("value")
+    if compare is _contains_any:
+        compare = _contains_any_of(expected)
+
+    if "question_id" in cond:
+        qid = cond["question_id"]
+
+        def check(answers: dict, context: dict) -> bool:
+            val = answers.get(qid)
+            return val is not None and compare(val, expected)
+        return check
+
+    if "context_field" in cond:
+        field = cond["context_field"]
+
+        def check(answers: dict, context: dict) -> bool:
+            val = context.get(field)
+            return val is not None and compare(val, expected)
+        return check
+
+    return lambda answers, context: False
+
+
+def _compile_branch_trigger(trigger: dict) -> _Predicate:
+    """Compound branch trigger: every condition must hold (none never fires)."""
+    checks = tuple(_compile_condition(c) for c in trigger.get("conditions", []))
+    if not checks:
+        return lambda answers, context: False
+    # Every current branch has one or two conditions; skip all() for those
+    if len(checks) == 1:
+        return checks[0]
+    if len(checks) == 2:
+        first, second = checks
+        return lambda answers, context: (
+            first(answers, context) and second(answers, context)
+        )
+    return lambda answers, context: all(c(answers, context) for c in checks)
+
+
+# (predicate, skip, add) per category dependency, in rule order
+_DEPENDENCY_RULES: tuple[tuple[_Predicate, frozenset[str], frozenset[str]], ...] = tuple(
+    (_compile_condition(dep["trigger"]),
+     dep.get("skip", frozenset()), dep.get("add", frozenset()))
+    for dep in CATEGORY_DEPENDENCIES
+)
+
+# (predicate, add) per second-level branch, in rule order
+_BRANCH_RULES: tuple[tuple[_Predicate, frozenset[str]], ...] = tuple(
+    (_compile_branch_trigger(branch["trigger"]), branch.get("add", frozenset()))
+    for branch in SECOND_LEVEL_BRANCHES
+)
+
+# (predicate, filter) per context filter; only context-field triggers apply
+_CONTEXT_FILTER_RULES: tuple[tuple[_Predicate, dict], ...] = tuple(
+    (_compile_condition(cf["trigger"]), cf)
+    for cf in CONTEXT_FILTERS
+    if cf.get("trigger", {}).get("context_field")
+)
 
 
 def _apply_context_filters(
     visible: set[str], context: dict
 ) -> set[str]:
     """Apply context-based filtering."""
-    from lib.mira_questions import CONTEXT_FILTERS
-
-    for cf in CONTEXT_FILTERS:
-        trigger = cf.get("trigger", {})
-        field = trigger.get("context_field")
-        if not field:
-            continue
-
-        ctx_val = context.get(field)
-        if ctx_val is None:
-            continue
-
-        if not _compare(ctx_val, trigger["operator"], trigger["value"]):
+    for triggered, cf in _CONTEXT_FILTER_RULES:
+        if not triggered({}, context):
             continue
 
         # Keep-only filter: restrict a category to specific questions
         if "keep_only" in cf:
             keep = cf["keep_only"]
             cat_id = keep["category"]
-            allowed = set(keep["questions"])
-            cat = CATEGORIES.get(cat_id, {})
-            all_cat_qs = set()
-            for qlist in ("capability_questions", "operational_questions",
-                          "conditional_questions", "branch_questions"):
-                all_cat_qs.update(cat.get(qlist, []))
+            allowed = keep["questions"]
             # Remove category questions not in allowed set
-            visible -= (all_cat_qs - allowed)
+            visible.difference_update(
+                qid for qid in _CATEGORY_QUESTIONS.get(cat_id, ())
+                if qid not in allowed
+            )
 
         # Reduce dimension: keep only high-priority questions
         if "reduce" in cf:
             red = cf["reduce"]
             dim = red["dimension"]
             keep_pct = red["keep_percentage"] / 100.0
-            dim_qs = [qid for qid in visible
-                      if QUESTIONS.get(qid, {}).get("dimension") == dim]
+            dim_set = _DIMENSION_QUESTIONS.get(dim, frozenset())
+            dim_qs = [qid for qid in visible if qid in dim_set]
             # Sort by weight descending, keep top N%
             dim_qs.sort(
-                key=lambda qid: QUESTIONS.get(qid, {}).get("weight", 1.0),
+                key=lambda qid: _QUESTION_WEIGHTS.get(qid, 1.0),
                 reverse=True,
             )
             keep_n = max(1, int(len(dim_qs) * keep_pct))
@@ -352,11 +466,8 @@ def _apply_progressive_disclosure(
             for cat_id, cat in CATEGORIES.items():
                 if cat.get("branch_only"):
                     continue
-                # Check for category-specific PD rules
-                has_specific = any(
-                    p.get("scope") == cat_id for p in PROGRESSIVE_DISCLOSURE
-                )
-                if has_specific:
+                # Skip categories with category-specific PD rules
+                if cat_id in _PD_SCOPED_CATEGORIES:
                     continue
 
                 cap_qs = cat.get("capability_questions", [])
@@ -386,11 +497,10 @@ def _apply_progressive_disclosure(
                         val, cond["operator"], cond["value"]
                     ):
                         # Condition not met — hide this stage's questions
-                        qs = stage.get("questions", [])
-                        result -= set(qs)
+                        result -= stage.get("questions", frozenset())
                         # Also hide all later stages
                         for later in stages[i + 1:]:
-                            result -= set(later.get("questions", []))
+                            result -= later.get("questions", frozenset())
                         break
 
     return result
@@ -398,14 +508,7 @@ def _apply_progressive_disclosure(
 
 def _order_questions(visible: set[str]) -> list[str]:
     """Order visible questions by category, then capability before operational."""
-    ordered = []
-    for cat_id, cat in CATEGORIES.items():
-        for qlist in ("capability_questions", "operational_questions",
-                      "conditional_questions", "branch_questions"):
-            for qid in cat.get(qlist, []):
-                if qid in visible and qid not in ordered:
-                    ordered.append(qid)
-    return ordered
+    return [qid for qid in _QUESTION_ORDER if qid in visible]
 
 
 # ---------------------------------------------------------------------------
@@ -449,30 +552,16 @@ def compute_scores(
         ops_total = 0.0
         ops_weight = 0.0
 
-        # Collect all question lists for this category
-        all_qs = set()
-        for qlist in ("capability_questions", "operational_questions",
-                      "conditional_questions", "branch_questions"):
-            all_qs.update(cat.get(qlist, []))
-
-        for qid in all_qs:
-            if qid not in question_scores:
-                continue
-            if qid not in visible:
-                continue
-
-            q = QUESTIONS[qid]
-            w = q.get("weight", 1.0)
-            if w <= 0:
+        # question_scores only holds visible questions
+        for qid, is_cap, w in _CATEGORY_WEIGHTS[cat_id]:
+            score = question_scores.get(qid)
+            if score is None:
                 continue
 
-            score = question_scores[qid]
-            dim = q["dimension"]
-
-            if dim == "capability":
+            if is_cap:
                 cap_total += score * w
                 cap_weight += w
-            elif dim == "operational":
+            else:
                 ops_total += score * w
                 ops_weight += w
 
@@ -625,33 +714,37 @@ def get_category_questions(
     cat_id: str,
     answers: dict[str, Any],
     context: dict[str, Any] | None = None,
+    visible: Collection[str] | None = None,
 ) -> list[dict[str, Any]]:
     """Get visible questions for a single category, with metadata.
 
+    Pass ``visible`` (a get_visible_questions result for the same answers
+    and context) when rendering several categories, so the filtering
+    pipeline runs once rather than per category.
+
     Returns list of question dicts augmented with:
         id, visible, answered, current_answer, score
     """
-    visible_set = set(get_visible_questions(answers, context or {}))
-    cat = CATEGORIES.get(cat_id, {})
+    if visible is None:
+        visible = get_visible_questions(answers, context or {})
+    visible_set = visible if isinstance(visible, (set, frozenset)) else set(visible)
     result = []
 
-    for qlist in ("capability_questions", "operational_questions",
-                  "conditional_questions", "branch_questions"):
-        for qid in cat.get(qlist, []):
-            q = QUESTIONS.get(qid)
-            if q is None:
-                continue
-            is_visible = qid in visible_set
-            ans = answers.get(qid)
-            score = normalise_answer(qid, ans) if ans is not None else None
-
-            result.append({
-                **q,
-                "id": qid,
-                "visible": is_visible,
-                "answered": ans is not None,
-                "current_answer": ans,
-                "score": score,
-            })
+    for qid in _CATEGORY_QUESTIONS.get(cat_id, ()):
+        q = QUESTIONS.get(qid)
+        if q is None:
+            continue
+        is_visible = qid in visible_set
+        ans = answers.get(qid)
+        score = normalise_answer(qid, ans) if ans is not None else None
+
+        result.append({
+            **q,
+            "id": qid,
+            "visible": is_visible,
+            "answered": ans is not None,
+            "current_answer": ans,
+            "score": score,
+        })
 
     return result
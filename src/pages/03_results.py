@@ -24,7 +24,7 @@ from dimension_slider_mapping import (
 from lib.components import (
     LAYER_MAP,
     GRADIENT_MODE,
-    ARCHETYPE_DESCRIPTIONS,
+    get_archetype_description,
     compute_grid,
     compute_gradient_grid,
     compute_zone_metrics,
@@ -141,7 +141,7 @@ gradient_grid = compute_gradient_grid(dims_tuple, sliders_tuple)
 is_gradient = (layer == GRADIENT_MODE)
 
 # Zone metrics
-zone_area, cap_range, ops_range = compute_zone_metrics(grid)
+zone_area, cap_range, ops_range, viable_mask = compute_zone_metrics(grid)
 cap_floor = compute_cap_floor(dims)
 ops_floor = compute_ops_floor(dims)
 
@@ -166,7 +166,7 @@ if len(alts) > 1:
     alt_text = " | ".join(f"{a} ({d:.1f})" for a, d in alts[1:])
     st.caption(f"Alternatives: {alt_text}")
 
-st.info(ARCHETYPE_DESCRIPTIONS.get(archetype, ""), icon="\U0001f4cb")
+st.info(get_archetype_description(archetype), icon="\U0001f4cb")
 
 
 # ---------------------------------------------------------------------------
@@ -228,6 +228,7 @@ with col_map:
         is_gradient=is_gradient,
         show_floors=show_floors,
         show_default=show_default,
+        viable_mask=viable_mask,
     )
     fig.update_layout(height=500)
     st.plotly_chart(fig, use_container_width=True)
@@ -13,6 +13,7 @@ from viable_zones import ARCHETYPE_DEFAULT_POSITIONS
 from lib.components import (
     PERSONA_DESCRIPTIONS,
     ARCHETYPE_DESCRIPTIONS,
+    get_persona_description,
     render_persona_correlation,
 )
 from lib.supabase_client import log_identification, log_feedback
@@ -72,7 +73,7 @@ if id_mode == "One of these personas matches my project":
     )
 
     # Show description
-    desc = PERSONA_DESCRIPTIONS.get(persona, "")
+    desc = get_persona_description(persona)
     st.caption(desc)
 
     if st.button("Submit identification", type="primary", key="submit_existing"):
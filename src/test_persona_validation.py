@@ -15,6 +15,16 @@ from __future__ import annotations
 import random
 from typing import Any
 
+import numpy as np
+
+from dimension_slider_mapping import ARCHETYPE_SLIDER_DEFAULTS
+from mira_bridge import bridge_mira_to_simulation, PERSONA_CONTEXTS
+from viable_zones import (
+    evaluate_batch,
+    test_viable,
+    test_sufficient,
+    test_sustainable,
+)
 from lib.mira_questions import (
     QUESTIONS,
     CATEGORIES,
@@ -785,7 +795,48 @@ def run_validation(seed: int = 42) -> bool:
     return all_passed
 
 
+# ---------------------------------------------------------------------------
+# Batched vs scalar viability tests
+# ---------------------------------------------------------------------------
+
+def check_batch_parity(tolerance: float = 1e-12) -> bool:
+    """Check evaluate_batch() against the scalar tests for the 12 personas.
+
+    Uses the same inputs as the persona correlation table: each bridged
+    persona's Cap/Ops and dimensions with its archetype's default sliders.
+    """
+    print("\n" + "=" * 90)
+    print("BATCHED TEST PARITY")
+    print("=" * 90)
+
+    bridged = [
+        bridge_mira_to_simulation(data) | {"name": name}
+        for name, data in PERSONA_CONTEXTS.items()
+    ]
+    caps = np.array([b.get("cap", 0.5) for b in bridged])
+    ops = np.array([b.get("ops", 0.5) for b in bridged])
+    dims = np.array([b["dimensions"] for b in bridged])
+    sliders = np.array([ARCHETYPE_SLIDER_DEFAULTS[b["archetype"]] for b in bridged])
+
+    batch = evaluate_batch(caps, ops, dims, sliders)
+
+    mismatches = 0
+    for i, b in enumerate(bridged):
+        args = (float(caps[i]), float(ops[i]), list(b["dimensions"]),
+                list(ARCHETYPE_SLIDER_DEFAULTS[b["archetype"]]))
+        scalar = (test_viable(*args), test_sufficient(*args), test_sustainable(*args))
+        worst = max(abs(batch[t, i] - scalar[t]) for t in range(3))
+        ok = worst <= tolerance
+        if not ok:
+            mismatches += 1
+        print(f"  {b['name']:<30} max diff {worst:.1e}  {'PASS' if ok else 'FAIL'}")
+
+    print(f"\nParity: {len(bridged) - mismatches}/{len(bridged)}")
+    return mismatches == 0
+
+
 if __name__ == "__main__":
     import sys
     success = run_validation()
-    sys.exit(0 if success else 1)
+    parity = check_batch_parity()
+    sys.exit(0 if success and parity else 1)
@@ -38,6 +38,22 @@ GRID_RESOLUTION = 101  # 0% to 100% in 1% steps
 PASS_THRESHOLD = 0.5   # Score >= this means the test passes
 SIGMOID_K = 12         # Sharpness of sigmoid transitions
 
+# Calibrated model constants, shared by the scalar and batched tests
+_CAP_FLOOR_BASE = 0.10
+_CAP_FLOOR_WEIGHTS = (0.15, 0.10, 0.15, 0.05)  # D1, D3, D4, D6
+_CAP_FLOOR_MAX = 0.80
+_OPS_FLOOR_BASE = 0.08
+_OPS_FLOOR_WEIGHTS = (0.20, 0.10)              # D2, D3
+_OPS_FLOOR_MAX = 0.60
+_SLIDER_BUFFER = 0.15      # Recovery/overwork credit towards the floors
+_TEST_TEMPERATURE = 0.08   # Margin scale before the sigmoid
+_DEBT_MATURITY = 0.30      # Average maturity below which debt accrues
+_DEBT_RATE = 2.0
+_PROCESS_RATE = 0.45       # Process cost per unit Cap without investment
+_EXECUTION_RATE = 0.35     # Execution cost per unit Ops without capacity
+_INVESTMENT_RELIEF = 0.10  # Cost relief per unit investment
+_COST_THRESHOLD = 0.35     # Net cost above this is unsustainable
+
 
 # ---------------------------------------------------------------------------
 # Archetype dimension profiles
@@ -112,6 +128,31 @@ def _sigmoid(x: float) -> float:
 # ---------------------------------------------------------------------------
 # Floor functions
 # ---------------------------------------------------------------------------
+# The *_uncapped and *_margin helpers take floats or arrays, so the scalar
+# and batched tests share one copy of the arithmetic.
+
+def _cap_floor_uncapped(d1, d3, d4, d6):
+    """Capability floor from normalised D1/D3/D4/D6, before the cap."""
+    w1, w3, w4, w6 = _CAP_FLOOR_WEIGHTS
+    return _CAP_FLOOR_BASE + w1 * d1 + w3 * d3 + w4 * d4 + w6 * d6
+
+
+def _ops_floor_uncapped(d2, d3):
+    """Operations floor from normalised D2/D3, before the cap."""
+    w2, w3 = _OPS_FLOOR_WEIGHTS
+    return _OPS_FLOOR_BASE + w2 * d2 + w3 * d3
+
+
+def _floor_margin(value, buffer_slider, floor):
+    """Viable/sufficient margin: slider-buffered value above its floor."""
+    return (value + buffer_slider * _SLIDER_BUFFER - floor) / _TEST_TEMPERATURE
+
+
+def _sustainable_margin(total_cost, investment):
+    """Sustainable margin: net cost below the threshold."""
+    investment_relief = investment * _INVESTMENT_RELIEF
+    return (_COST_THRESHOLD - (total_cost - investment_relief)) / _TEST_TEMPERATURE
+
 
 def compute_cap_floor(dims: list[int]) -> float:
     """Minimum viable capability given project stakes.
@@ -124,8 +165,7 @@ def compute_cap_floor(dims: list[int]) -> float:
     d4 = _norm(dims[3])  # Regulation
     d6 = _norm(dims[5])  # Outsourcing
 
-    floor = 0.10 + 0.15 * d1 + 0.10 * d3 + 0.15 * d4 + 0.05 * d6
-    return min(floor, 0.80)
+    return min(_cap_floor_uncapped(d1, d3, d4, d6), _CAP_FLOOR_MAX)
 
 
 def compute_ops_floor(dims: list[int]) -> float:
@@ -137,8 +177,7 @@ def compute_ops_floor(dims: list[int]) -> float:
     d2 = _norm(dims[1])  # Market pressure
     d3 = _norm(dims[2])  # Complexity
 
-    floor = 0.08 + 0.20 * d2 + 0.10 * d3
-    return min(floor, 0.60)
+    return min(_ops_floor_uncapped(d2, d3), _OPS_FLOOR_MAX)
 
 
 # ---------------------------------------------------------------------------
@@ -152,14 +191,8 @@ def test_viable(cap: float, ops: float,
     Recovery capacity provides a buffer — organisations with high recovery
     can tolerate being slightly below the capability floor.
     """
-    cap_floor = compute_cap_floor(dims)
-    recovery = sliders[1]
-
     # Recovery provides a safety buffer on the cap floor
-    effective_cap = cap + recovery * 0.15
-    temperature = 0.08
-
-    return _sigmoid((effective_cap - cap_floor) / temperature)
+    return _sigmoid(_floor_margin(cap, sliders[1], compute_cap_floor(dims)))
 
 
 def test_sufficient(cap: float, ops: float,
@@ -169,14 +202,8 @@ def test_sufficient(cap: float, ops: float,
     Overwork capacity compensates for low operational performance —
     teams working harder can ship despite weak operational metrics.
     """
-    ops_floor = compute_ops_floor(dims)
-    overwork = sliders[2]
-
     # Overwork compensates for ops deficit
-    effective_ops = ops + overwork * 0.15
-    temperature = 0.08
-
-    return _sigmoid((effective_ops - ops_floor) / temperature)
+    return _sigmoid(_floor_margin(ops, sliders[2], compute_ops_floor(dims)))
 
 
 def test_sustainable(cap: float, ops: float,
@@ -212,24 +239,22 @@ def test_sustainable(cap: float, ops: float,
 
     # Debt cost: very low maturity accumulates compounding debt
     avg_maturity = (cap + ops) / 2.0
-    debt_cost = max(0.0, 0.30 - avg_maturity) * 2.0
+    debt_cost = max(0.0, _DEBT_MATURITY - avg_maturity) * _DEBT_RATE
 
     # Process maintenance cost: high cap requires investment to maintain
     # governance, documentation, standards, quality gates
-    process_cost = cap * 0.45 * (1.0 - investment)
+    process_cost = cap * _PROCESS_RATE * (1.0 - investment)
 
     # Execution overhead: high ops requires capacity to sustain delivery
     # cadence, automation, monitoring, incident response
     # Recovery (automation) can sustain execution cadence alongside overwork/time
     best_ops_capacity = max(overwork, time_cap, recovery)
-    execution_cost = ops * 0.35 * (1.0 - best_ops_capacity)
+    execution_cost = ops * _EXECUTION_RATE * (1.0 - best_ops_capacity)
 
     # Total cost with investment relief
     total_cost = gap_cost + debt_cost + process_cost + execution_cost
-    investment_relief = investment * 0.10
-    temperature = 0.08
 
-    return _sigmoid((0.35 - (total_cost - investment_relief)) / temperature)
+    return _sigmoid(_sustainable_margin(total_cost, investment))
 
 
 def combined_score(cap: float, ops: float,
@@ -242,6 +267,80 @@ def combined_score(cap: float, ops: float,
     )
 
 
+# ---------------------------------------------------------------------------
+# Batched success tests
+# ---------------------------------------------------------------------------
+# Array versions of the three tests for evaluating many independent
+# positions at once (e.g. all 12 personas, each with its own dims/sliders).
+# Shapes: caps/ops (n,), dims (n, 8), sliders (n, 4). Arithmetic mirrors
+# the scalar tests above exactly.
+
+def _sigmoid_batch(x: np.ndarray) -> np.ndarray:
+    """Vectorised sigmoid, identical in shape to _sigmoid()."""
+    return 1.0 / (1.0 + np.exp(-SIGMOID_K * x))
+
+
+def test_viable_batch(caps: np.ndarray, ops: np.ndarray,
+                      dims: np.ndarray, sliders: np.ndarray) -> np.ndarray:
+    """Batched test_viable(): one score per row."""
+    norm = (np.asarray(dims, dtype=float) - 1) / 4.0
+    cap_floor = np.minimum(
+        _cap_floor_uncapped(norm[:, 0], norm[:, 2], norm[:, 3], norm[:, 5]),
+        _CAP_FLOOR_MAX,
+    )
+    return _sigmoid_batch(_floor_margin(caps, sliders[:, 1], cap_floor))
+
+
+def test_sufficient_batch(caps: np.ndarray, ops: np.ndarray,
+                          dims: np.ndarray, sliders: np.ndarray) -> np.ndarray:
+    """Batched test_sufficient(): one score per row."""
+    norm = (np.asarray(dims, dtype=float) - 1) / 4.0
+    ops_floor = np.minimum(
+        _ops_floor_uncapped(norm[:, 1], norm[:, 2]), _OPS_FLOOR_MAX
+    )
+    return _sigmoid_batch(_floor_margin(ops, sliders[:, 2], ops_floor))
+
+
+def test_sustainable_batch(caps: np.ndarray, ops: np.ndarray,
+                           dims: np.ndarray, sliders: np.ndarray) -> np.ndarray:
+    """Batched test_sustainable(): one score per row."""
+    investment = sliders[:, 0]
+    recovery = sliders[:, 1]
+    overwork = sliders[:, 2]
+    time_cap = sliders[:, 3]
+
+    gap = np.abs(caps - ops)
+    gap_cost = np.where(
+        caps > ops,
+        gap * (1.0 - time_cap),
+        gap * (1.0 - np.maximum(overwork, recovery)),
+    )
+    debt_cost = np.maximum(0.0, _DEBT_MATURITY - (caps + ops) / 2.0) * _DEBT_RATE
+    process_cost = caps * _PROCESS_RATE * (1.0 - investment)
+    best_ops_capacity = np.maximum(np.maximum(overwork, time_cap), recovery)
+    execution_cost = ops * _EXECUTION_RATE * (1.0 - best_ops_capacity)
+
+    total_cost = gap_cost + debt_cost + process_cost + execution_cost
+    return _sigmoid_batch(_sustainable_margin(total_cost, investment))
+
+
+def evaluate_batch(caps: np.ndarray, ops: np.ndarray,
+                   dims: np.ndarray, sliders: np.ndarray) -> np.ndarray:
+    """All three batched tests in one call.
+
+    Returns array of shape (3, n): rows are viable, sufficient and
+    sustainable scores (grid-layer order), so min/argmin over axis 0
+    give the combined score and binding constraint per position.
+    """
+    dims = np.asarray(dims, dtype=float)
+    sliders = np.asarray(sliders, dtype=float)
+    return np.stack([
+        test_viable_batch(caps, ops, dims, sliders),
+        test_sufficient_batch(caps, ops, dims, sliders),
+        test_sustainable_batch(caps, ops, dims, sliders),
+    ])
+
+
 def raw_margins(cap: float, ops: float,
                 dims: list[int], sliders: list[float]) -> tuple[float, float, float]:
     """Pre-sigmoid margins for all three tests.
@@ -253,16 +352,12 @@ def raw_margins(cap: float, ops: float,
     Returns: (viable_margin, sufficient_margin, sustainable_margin)
     """
     # Viable margin
-    cap_floor = compute_cap_floor(dims)
     recovery = sliders[1]
-    effective_cap = cap + recovery * 0.15
-    viable_m = (effective_cap - cap_floor) / 0.08
+    viable_m = _floor_margin(cap, recovery, compute_cap_floor(dims))
 
     # Sufficient margin
-    ops_floor = compute_ops_floor(dims)
     overwork = sliders[2]
-    effective_ops = ops + overwork * 0.15
-    sufficient_m = (effective_ops - ops_floor) / 0.08
+    sufficient_m = _floor_margin(ops, overwork, compute_ops_floor(dims))
 
     # Sustainable margin (replicate cost arithmetic)
     investment = sliders[0]
@@ -273,13 +368,12 @@ def raw_margins(cap: float, ops: float,
     else:
         gap_cost = gap * (1.0 - max(overwork, recovery))
     avg_maturity = (cap + ops) / 2.0
-    debt_cost = max(0.0, 0.30 - avg_maturity) * 2.0
-    process_cost = cap * 0.45 * (1.0 - investment)
+    debt_cost = max(0.0, _DEBT_MATURITY - avg_maturity) * _DEBT_RATE
+    process_cost = cap * _PROCESS_RATE * (1.0 - investment)
     best_ops_capacity = max(overwork, time_cap, recovery)
-    execution_cost = ops * 0.35 * (1.0 - best_ops_capacity)
+    execution_cost = ops * _EXECUTION_RATE * (1.0 - best_ops_capacity)
     total_cost = gap_cost + debt_cost + process_cost + execution_cost
-    investment_relief = investment * 0.10
-    sustainable_m = (0.35 - (total_cost - investment_relief)) / 0.08
+    sustainable_m = _sustainable_margin(total_cost, investment)
 
     return viable_m, sufficient_m, sustainable_m
 
@@ -323,10 +417,10 @@ def cost_breakdown(cap: float, ops: float,
 
     # Debt cost
     avg_maturity = (cap + ops) / 2.0
-    debt_cost = max(0.0, 0.30 - avg_maturity) * 2.0
+    debt_cost = max(0.0, _DEBT_MATURITY - avg_maturity) * _DEBT_RATE
 
     # Process cost
-    process_cost = cap * 0.45 * (1.0 - investment)
+    process_cost = cap * _PROCESS_RATE * (1.0 - investment)
 
     # Execution cost
     best_ops_capacity = max(overwork, time_cap, recovery)
@@ -336,13 +430,13 @@ def cost_breakdown(cap: float, ops: float,
         exec_compensator = "Recovery"
     else:
         exec_compensator = "Overwork"
-    execution_cost = ops * 0.35 * (1.0 - best_ops_capacity)
+    execution_cost = ops * _EXECUTION_RATE * (1.0 - best_ops_capacity)
 
     # Totals
     total_cost = gap_cost + debt_cost + process_cost + execution_cost
-    investment_relief = investment * 0.10
+    investment_relief = investment * _INVESTMENT_RELIEF
     net_cost = total_cost - investment_relief
-    threshold = 0.35
+    threshold = _COST_THRESHOLD
     headroom = threshold - net_cost
 
     # Find the dominant cost
@@ -515,8 +609,13 @@ def analyse_archetype(archetype: str) -> ZoneAnalysis:
     du = test_sustainable(default_cap, default_ops, dims, sliders)
     dc = min(dv, ds, du)
 
-    scores = {"viable": dv, "sufficient": ds, "sustainable": du}
-    binding = min(scores, key=scores.get)
+    # Binding constraint: first test with the lowest score
+    if dv <= ds and dv <= du:
+        binding = "viable"
+    elif ds <= du:
+        binding = "sufficient"
+    else:
+        binding = "sustainable"
 
     return ZoneAnalysis(
         archetype=archetype,
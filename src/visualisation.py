@@ -13,7 +13,9 @@ Depends on: viable_zones.py, dimension_slider_mapping.py
 
 from __future__ import annotations
 
+import functools
 import json
+from dataclasses import dataclass
 
 import numpy as np
 import streamlit as st
@@ -27,10 +29,12 @@ from viable_zones import (
     test_viable,
     test_sufficient,
     test_sustainable,
+    evaluate_batch,
     ARCHETYPE_DIMENSIONS,
     ARCHETYPE_DEFAULT_POSITIONS,
     ARCHETYPE_ORDER,
     PASS_THRESHOLD,
+    GRID_RESOLUTION,
     compute_cap_floor,
     compute_ops_floor,
 )
@@ -82,48 +86,90 @@ GRADIENT_COLOURSCALE = [
 ]
 GRADIENT_CLIP = 4.0  # Clip raw margins to [-4, +4] for display
 
+# Colourscales coerced once into Plotly's canonical tuple form, so the
+# unvalidated heatmap trace receives exactly what validation would produce
+_ZONE_COLOURSCALE_V = go.Heatmap(colorscale=ZONE_COLOURSCALE).colorscale
+_GRADIENT_COLOURSCALE_V = go.Heatmap(colorscale=GRADIENT_COLOURSCALE).colorscale
+_GRADIENT_LEVELS = 255  # Gradient display is quantised to uint8 levels
+# Margin -> level affine map: -CLIP lands on 0, +CLIP on _GRADIENT_LEVELS
+_GRADIENT_SCALE = _GRADIENT_LEVELS / (2 * GRADIENT_CLIP)
+_GRADIENT_OFFSET = GRADIENT_CLIP * _GRADIENT_SCALE
+_GRADIENT_COLORBAR = dict(
+    title=dict(text="Margin"),
+    tickvals=[f * _GRADIENT_LEVELS for f in (0.0, 0.25, 0.5, 0.75, 1.0)],
+    ticktext=[f"{-GRADIENT_CLIP:.0f}", f"{-GRADIENT_CLIP/2:.0f}",
+              "0", f"+{GRADIENT_CLIP/2:.0f}", f"+{GRADIENT_CLIP:.0f}"],
+    len=0.75,
+)
+
+# Normalised grid steps and percentage axis for the fixed sweep resolution
+_GRID_STEPS = np.linspace(0.0, 1.0, GRID_RESOLUTION)
+_GRID_AXIS_PCT = np.linspace(0, 100, GRID_RESOLUTION)
+
+# Test names in grid-layer order, used to label the binding constraint
+_TEST_NAMES = ("Viable", "Sufficient", "Sustainable")
+
 
 # ---------------------------------------------------------------------------
 # Cached computation
 # ---------------------------------------------------------------------------
 
-@st.cache_data
+# Grids are cached as shared, read-only resources: cache_resource skips the
+# pickle round-trip cache_data pays on every hit for a 101x101x4 array.
+
+@st.cache_resource(max_entries=64)
 def compute_grid(dims_tuple: tuple, sliders_tuple: tuple) -> np.ndarray:
     """Compute the 101x101 grid, cached by (dims, sliders)."""
-    return sweep_grid(list(dims_tuple), list(sliders_tuple))
+    grid = sweep_grid(list(dims_tuple), list(sliders_tuple))
+    grid.setflags(write=False)
+    return grid
 
 
-@st.cache_data
+@st.cache_resource(max_entries=64)
 def compute_gradient_grid(dims_tuple: tuple, sliders_tuple: tuple) -> np.ndarray:
     """Compute the 101x101 raw margin grid, cached by (dims, sliders)."""
-    return sweep_grid_gradient(list(dims_tuple), list(sliders_tuple))
+    grid = sweep_grid_gradient(list(dims_tuple), list(sliders_tuple))
+    grid.setflags(write=False)
+    return grid
 
 
 def compute_zone_metrics(grid: np.ndarray):
-    """Derive zone area and cap/ops ranges from a grid."""
+    """Derive zone area, cap/ops ranges and the viable mask from a grid.
+
+    The mask is returned so build_heatmap_figure can reuse it rather than
+    rescanning the combined layer.
+    """
     combined = grid[:, :, 3]
     viable_mask = combined >= PASS_THRESHOLD
-    zone_area_pct = float(np.mean(viable_mask)) * 100.0
+    zone_area_pct = float(viable_mask.sum()) * (100.0 / viable_mask.size)
 
-    steps = np.linspace(0.0, 1.0, grid.shape[0])
+    # Bounding box from 1-D row/column reductions (no index array)
+    rows_any = viable_mask.any(axis=1)  # Ops axis
+    if not rows_any.any():
+        return zone_area_pct, (0.0, 0.0), (0.0, 0.0), viable_mask
+    cols_any = viable_mask.any(axis=0)  # Cap axis
 
-    if np.any(viable_mask):
-        coords = np.argwhere(viable_mask)
-        cap_range = (float(steps[coords[:, 1].min()]),
-                     float(steps[coords[:, 1].max()]))
-        ops_range = (float(steps[coords[:, 0].min()]),
-                     float(steps[coords[:, 0].max()]))
-    else:
-        cap_range = (0.0, 0.0)
-        ops_range = (0.0, 0.0)
+    n = grid.shape[0]
+    steps = _GRID_STEPS if n == GRID_RESOLUTION else np.linspace(0.0, 1.0, n)
+    cap_range = (float(steps[cols_any.argmax()]),
+                 float(steps[n - 1 - cols_any[::-1].argmax()]))
+    ops_range = (float(steps[rows_any.argmax()]),
+                 float(steps[n - 1 - rows_any[::-1].argmax()]))
 
-    return zone_area_pct, cap_range, ops_range
+    return zone_area_pct, cap_range, ops_range, viable_mask
 
 
-@st.cache_data
 def compute_scores(cap: float, ops: float,
                    dims_tuple: tuple, sliders_tuple: tuple) -> dict:
     """Evaluate the three tests at a specific position."""
+    # Quantise the position so sub-step jitter shares a cache entry; copy the
+    # cached dict so a caller's edits can't leak into later hits
+    return dict(_compute_scores(round(cap, 3), round(ops, 3), dims_tuple, sliders_tuple))
+
+
+@functools.lru_cache(maxsize=1024)
+def _compute_scores(cap: float, ops: float,
+                    dims_tuple: tuple, sliders_tuple: tuple) -> dict:
     dims = list(dims_tuple)
     sliders = list(sliders_tuple)
     v = test_viable(cap, ops, dims, sliders)
@@ -165,6 +211,11 @@ def _sync_archetype_change():
 # Figure builder
 # ---------------------------------------------------------------------------
 
+def _axis_pct(n: int) -> np.ndarray:
+    """0-100% axis values for an n-point grid dimension."""
+    return _GRID_AXIS_PCT if n == GRID_RESOLUTION else np.linspace(0, 100, n)
+
+
 def build_heatmap_figure(
     grid: np.ndarray,
     dims: list[int],
@@ -176,42 +227,43 @@ def build_heatmap_figure(
     is_gradient: bool = False,
     show_floors: bool = False,
     show_default: bool = False,
+    viable_mask: np.ndarray | None = None,
 ) -> go.Figure:
-    """Build the Plotly heatmap with contour, floor lines, and markers."""
-    cap_vals = np.linspace(0, 100, grid.shape[1])
-    ops_vals = np.linspace(0, 100, grid.shape[0])
+    """Build the Plotly heatmap with contour, floor lines, and markers.
 
-    fig = go.Figure()
+    Pass the viable_mask from compute_zone_metrics to skip recomputing it.
+    """
+    cap_vals = _axis_pct(grid.shape[1])
+    ops_vals = _axis_pct(grid.shape[0])
 
+    # The heatmap trace is built as a plain dict and wrapped unvalidated:
+    # Plotly's validators otherwise walk the z/customdata arrays on every
+    # slider tick. All attributes below are static.
     if is_gradient and gradient_grid is not None:
         # Gradient mode: show raw margins with smooth colour gradient
-        data = np.clip(gradient_grid[:, :, layer_idx], -GRADIENT_CLIP, GRADIENT_CLIP)
-        # Normalise to [0, 1] for the colourscale (0 = -CLIP, 0.5 = 0, 1 = +CLIP)
-        display_data = (data + GRADIENT_CLIP) / (2 * GRADIENT_CLIP)
-
-        # Customdata: raw margin values for hover
-        customdata = np.stack([
-            gradient_grid[:, :, 0],
-            gradient_grid[:, :, 1],
-            gradient_grid[:, :, 2],
-            gradient_grid[:, :, 3],
-        ], axis=-1)
-
-        fig.add_trace(go.Heatmap(
+        # Map margins straight onto uint8 levels in one scratch buffer:
+        # scale and shift, then clip in level space (0 = -CLIP, mid = 0,
+        # top = +CLIP). The colourscale has 9 stops, so quantising is
+        # visually identical and a quarter of the float64 payload
+        display_data = np.multiply(gradient_grid[:, :, layer_idx], _GRADIENT_SCALE)
+        display_data += _GRADIENT_OFFSET
+        np.clip(display_data, 0, _GRADIENT_LEVELS, out=display_data)
+        display_data = np.rint(display_data, out=display_data).astype(np.uint8)
+
+        # Customdata: raw margin values for hover (grid is already (H, W, 4)).
+        # float32 is ample for the 2 d.p. hover text and halves the payload.
+        customdata = np.ascontiguousarray(gradient_grid, dtype=np.float32)
+
+        heatmap = dict(
+            type="heatmap",
             z=display_data,
             x=cap_vals,
             y=ops_vals,
             customdata=customdata,
-            colorscale=GRADIENT_COLOURSCALE,
-            zmin=0.0,
-            zmax=1.0,
-            colorbar=dict(
-                title=dict(text="Margin"),
-                tickvals=[0.0, 0.25, 0.5, 0.75, 1.0],
-                ticktext=[f"{-GRADIENT_CLIP:.0f}", f"{-GRADIENT_CLIP/2:.0f}",
-                          "0", f"+{GRADIENT_CLIP/2:.0f}", f"+{GRADIENT_CLIP:.0f}"],
-                len=0.75,
-            ),
+            colorscale=_GRADIENT_COLOURSCALE_V,
+            zmin=0,
+            zmax=_GRADIENT_LEVELS,
+            colorbar=_GRADIENT_COLORBAR,
             hovertemplate=(
                 "Cap: %{x:.0f}%<br>"
                 "Ops: %{y:.0f}%<br>"
@@ -224,24 +276,21 @@ def build_heatmap_figure(
                 "0 = viable boundary, +ve = inside, -ve = outside"
                 "<extra></extra>"
             ),
-        ))
+        )
     else:
         # Standard sigmoid mode
-        data = grid[:, :, layer_idx]
+        data = grid[:, :, layer_idx].astype(np.float32)
 
-        customdata = np.stack([
-            grid[:, :, 0],
-            grid[:, :, 1],
-            grid[:, :, 2],
-            grid[:, :, 3],
-        ], axis=-1)
+        # Customdata: all four test scores for hover (grid is already (H, W, 4))
+        customdata = np.ascontiguousarray(grid, dtype=np.float32)
 
-        fig.add_trace(go.Heatmap(
+        heatmap = dict(
+            type="heatmap",
             z=data,
             x=cap_vals,
             y=ops_vals,
             customdata=customdata,
-            colorscale=ZONE_COLOURSCALE,
+            colorscale=_ZONE_COLOURSCALE_V,
             zmin=0.0,
             zmax=1.0,
             colorbar=dict(
@@ -259,20 +308,26 @@ def build_heatmap_figure(
                 "Combined: %{customdata[3]:.3f}"
                 "<extra></extra>"
             ),
-        ))
+        )
 
-    # Viable zone contour at 0.5 (always from sigmoid grid)
-    combined = grid[:, :, 3]
-    fig.add_trace(go.Contour(
-        z=combined,
-        x=cap_vals,
-        y=ops_vals,
-        contours=dict(start=0.5, end=0.5, size=0.1, coloring="none"),
-        line=dict(color="white", width=2, dash="dash"),
-        showscale=False,
-        hoverinfo="skip",
-        name="Viable boundary",
-    ))
+    fig = go.Figure()
+    fig.add_trace(go.Heatmap(heatmap, _validate=False))
+
+    # Viable zone contour at 0.5 (always from sigmoid grid). Skipped when
+    # the zone is empty or covers the whole grid: there is no boundary.
+    if viable_mask is None:
+        viable_mask = grid[:, :, 3] >= PASS_THRESHOLD
+    if viable_mask.any() and not viable_mask.all():
+        fig.add_trace(go.Contour(
+            z=grid[:, :, 3],
+            x=cap_vals,
+            y=ops_vals,
+            contours=dict(start=0.5, end=0.5, size=0.1, coloring="none"),
+            line=dict(color="white", width=2, dash="dash"),
+            showscale=False,
+            hoverinfo="skip",
+            name="Viable boundary",
+        ))
 
     # 3. Floor lines (optional)
     if show_floors:
@@ -386,6 +441,15 @@ _PERSONA_DESCRIPTIONS = {
     "P12 Legacy Modernisation": "Medium legacy system, waterfall, maintenance",
 }
 
+# Sidebar captions per persona, formatted once: (description, expected archetypes)
+_PERSONA_CAPTIONS = {
+    name: (
+        _PERSONA_DESCRIPTIONS.get(name, ""),
+        f"Expected archetype: {', '.join(PERSONA_EXPECTED.get(name, []))}",
+    )
+    for name in PERSONA_CONTEXTS
+}
+
 
 def _render_mira_import():
     """Render MIRA Import form in sidebar. Returns bridge result."""
@@ -401,10 +465,9 @@ def _render_mira_import():
 
     if persona != "Custom":
         # Show persona description
-        desc = _PERSONA_DESCRIPTIONS.get(persona, "")
-        expected = PERSONA_EXPECTED.get(persona, [])
-        st.sidebar.caption(f"{desc}")
-        st.sidebar.caption(f"Expected archetype: {', '.join(expected)}")
+        desc, expected = _PERSONA_CAPTIONS[persona]
+        st.sidebar.caption(desc)
+        st.sidebar.caption(expected)
 
         # Use the full persona data (context + answers + scores)
         return bridge_mira_to_simulation(PERSONA_CONTEXTS[persona])
@@ -712,33 +775,34 @@ DIMENSION_DESCRIPTIONS = {
 _INVERTED_DIMS = {"Team Stability", "Coherence"}
 
 
+# Traffic-light level per dimension: 0 = green, 1 = amber, 2 = red.
+# Inverted dimensions are good when high; the rest are demanding when high.
+_INVERTED_MASK = np.array([label in _INVERTED_DIMS for label in DIMENSION_LABELS])
+_LEVEL_COLOURS = ("#4CAF50", "#FFD54F", "#E57373")
+_LEVEL_INDICATORS = ("🟢", "🟡", "🔴")
+
+
+def _dimension_levels(dims: list[int]) -> np.ndarray:
+    """Traffic-light level (0-2) for each of the 8 dimension values."""
+    arr = np.asarray(dims)
+    good = np.where(_INVERTED_MASK, arr >= 4, arr <= 2)
+    mid = np.where(_INVERTED_MASK, arr >= 3, arr <= 3)
+    return np.select([good, mid], [0, 1], default=2)
+
+
 def render_dimension_chart(dims: list[int]):
     """Horizontal bar chart showing the 8 dimension values (1-5) with descriptions."""
-    colours = []
-    for label, v in zip(DIMENSION_LABELS, dims):
-        inverted = label in _INVERTED_DIMS
-        if inverted:
-            # High = good (green), low = bad (red)
-            if v >= 4:
-                colours.append("#4CAF50")
-            elif v >= 3:
-                colours.append("#FFD54F")
-            else:
-                colours.append("#E57373")
-        else:
-            # High = demanding (red), low = easy (green)
-            if v <= 2:
-                colours.append("#4CAF50")
-            elif v <= 3:
-                colours.append("#FFD54F")
-            else:
-                colours.append("#E57373")
-
-    # Build hover text with descriptions
-    hover_texts = []
-    for label, v in zip(DIMENSION_LABELS, dims):
+    levels = _dimension_levels(dims)
+    colours = [_LEVEL_COLOURS[i] for i in levels]
+
+    # Hover text and breakdown lines in a single pass over the dimensions
+    n = len(DIMENSION_LABELS)
+    hover_texts = [""] * n
+    lines = [""] * n
+    for i, (label, v, level) in enumerate(zip(DIMENSION_LABELS, dims, levels)):
         desc = DIMENSION_DESCRIPTIONS[label].get(v, "")
-        hover_texts.append(f"{label}: {v}/5<br>{desc}")
+        hover_texts[i] = f"{label}: {v}/5<br>{desc}"
+        lines[i] = f"{_LEVEL_INDICATORS[level]} **{label}** = {v}/5 — {desc}"
 
     fig = go.Figure()
     fig.add_trace(go.Bar(
@@ -764,56 +828,74 @@ def render_dimension_chart(dims: list[int]):
     st.plotly_chart(fig, use_container_width=True)
 
     # Full dimension breakdown in a visible box
-    lines = []
-    for label, v in zip(DIMENSION_LABELS, dims):
-        desc = DIMENSION_DESCRIPTIONS[label].get(v, "")
-        inverted = label in _INVERTED_DIMS
-        if inverted:
-            indicator = "🟢" if v >= 4 else ("🟡" if v >= 3 else "🔴")
-        else:
-            indicator = "🟢" if v <= 2 else ("🟡" if v <= 3 else "🔴")
-        lines.append(f"{indicator} **{label}** = {v}/5 — {desc}")
     st.markdown("\n\n".join(lines))
 
 
+# PERSONA_CONTEXTS is static, so each persona is bridged once at import
+_BRIDGED_PERSONAS: tuple[dict, ...] = tuple(
+    bridge_mira_to_simulation(data) | {"name": name}
+    for name, data in PERSONA_CONTEXTS.items()
+)
+
+
 @st.cache_data
 def compute_persona_correlation() -> list[dict]:
     """Evaluate all 12 MIRA personas against their matched archetype's viable zone."""
-    rows = []
-    for name, data in PERSONA_CONTEXTS.items():
-        result = bridge_mira_to_simulation(data)
-        arch = result["archetype"]
-        dims = result["dimensions"]
-        sliders = list(ARCHETYPE_SLIDER_DEFAULTS[arch])
-        cap = result.get("cap", 0.5)
-        ops = result.get("ops", 0.5)
-
-        v = test_viable(cap, ops, dims, sliders)
-        s = test_sufficient(cap, ops, dims, sliders)
-        u = test_sustainable(cap, ops, dims, sliders)
-        combined = min(v, s, u)
-
-        # Identify binding constraint
-        scores = {"Viable": v, "Sufficient": s, "Sustainable": u}
-        binding = min(scores, key=scores.get)
+    # Gather every persona's inputs first, then score them in one batch
+    results = _BRIDGED_PERSONAS
+    caps = np.array([r.get("cap", 0.5) for r in results])
+    ops_arr = np.array([r.get("ops", 0.5) for r in results])
+    dims_mat = np.array([r["dimensions"] for r in results])
+    sliders_mat = np.array([ARCHETYPE_SLIDER_DEFAULTS[r["archetype"]] for r in results])
+
+    scores = evaluate_batch(caps, ops_arr, dims_mat, sliders_mat)
+    v, s, u = scores
+    combined = scores.min(axis=0)
+    # Binding constraint: first test with the lowest score
+    binding = np.argmin(scores, axis=0)
 
+    rows = []
+    for i, result in enumerate(results):
+        name = result["name"]
+        passes = bool(combined[i] >= PASS_THRESHOLD)
         rows.append({
             "persona": name,
-            "cap": cap,
-            "ops": ops,
-            "archetype": arch,
-            "viable": v,
-            "sufficient": s,
-            "sustainable": u,
-            "combined": combined,
-            "passes": combined >= PASS_THRESHOLD,
-            "binding": binding if combined < PASS_THRESHOLD else "—",
+            "cap": float(caps[i]),
+            "ops": float(ops_arr[i]),
+            "archetype": result["archetype"],
+            "viable": float(v[i]),
+            "sufficient": float(s[i]),
+            "sustainable": float(u[i]),
+            "combined": float(combined[i]),
+            "passes": passes,
+            "binding": "—" if passes else _TEST_NAMES[binding[i]],
             "expected": PERSONA_EXPECTED.get(name, []),
             "confidence": result["confidence"],
         })
     return rows
 
 
+# Correlation table cells after the persona column, formatted per row
+_PERSONA_ROW_CELLS = (
+    "| {cap:.0%} | {ops:.0%} | {archetype} | {viable:.3f} | {sufficient:.3f} "
+    "| {sustainable:.3f} | {verdict} | {binding} |"
+)
+
+
+@st.cache_data
+def _persona_rows_cached() -> list[tuple[str, str]]:
+    """Pre-formatted correlation table cells (after the persona column).
+
+    The rows never change; only the bold highlight on the selected persona
+    does, so that is applied at render time.
+    """
+    return [
+        (r["persona"],
+         _PERSONA_ROW_CELLS.format(**r, verdict="VIABLE" if r["passes"] else "FAIL"))
+        for r in compute_persona_correlation()
+    ]
+
+
 def render_persona_correlation(selected_persona: str | None = None):
     """Display the MIRA persona correlation table."""
     st.markdown("#### MIRA Persona Correlation")
@@ -829,20 +911,10 @@ def render_persona_correlation(selected_persona: str | None = None):
         "| Persona | Cap | Ops | Archetype | Viable | Sufficient | Sustainable | Verdict | Binding |",
         "|---------|----:|----:|-----------|-------:|-----------:|------------:|---------|---------|",
     ]
-    for r in rows:
-        verdict = "VIABLE" if r["passes"] else "FAIL"
-        highlight = "**" if r["persona"] == selected_persona else ""
-        lines.append(
-            f"| {highlight}{r['persona']}{highlight} "
-            f"| {r['cap']:.0%} "
-            f"| {r['ops']:.0%} "
-            f"| {r['archetype']} "
-            f"| {r['viable']:.3f} "
-            f"| {r['sufficient']:.3f} "
-            f"| {r['sustainable']:.3f} "
-            f"| {verdict} "
-            f"| {r['binding']} |"
-        )
+    lines.extend(
+        f"| **{name}** {cells}" if name == selected_persona else f"| {name} {cells}"
+        for name, cells in _persona_rows_cached()
+    )
     st.markdown("\n".join(lines))
 
     # Summary stats
@@ -867,6 +939,152 @@ def render_persona_correlation(selected_persona: str | None = None):
             st.caption(f"**{r['persona']}**: {reason}")
 
 
+# Cost breakdown caption thresholds
+_GAP_BALANCED_MAX = 0.02  # Cap/Ops gap below this reads as balanced
+_GAP_COST_HIGH = 0.05     # Gap cost at or above this: compensator falls short
+_DEBT_COST_MIN = 0.01     # Debt cost below this is treated as none
+_COST_LOW = 0.03          # Process/execution cost below this is minimal
+_COST_HIGH = 0.10         # Process/execution cost above this is significant
+
+# Cost breakdown caption templates, bound to str.format once at import
+_GAP_BALANCED = "Cap and Ops are balanced — no mismatch penalty."
+# Gap and escalation endings are picked by indexing with a threshold test
+# rather than branching: index 1 when the cost crosses its escalation threshold
+_GAP_EXTENT = ("most", "some")
+_GAP_CAP_OVER_BODY = (
+    "**Cap > Ops by {gap:.0%}** — you have more governance/process "
+    "than delivery output. In practice: review cycles with little to review, "
+    "compliance checkpoints with few deliverables passing through, quality gates "
+    "that slow work but aren't justified by throughput. "
+    "**{comp}** ({comp_value:.2f}) absorbs {extent} of this — "
+)
+_GAP_CAP_OVER = (
+    (_GAP_CAP_OVER_BODY + "the organisation can afford to be slow and thorough.").format,
+    (_GAP_CAP_OVER_BODY + "but not enough. Need more **Time** (schedule slack) "
+     "to justify heavy process with low output.").format,
+)
+_GAP_OPS_OVER_BODY = (
+    "**Ops > Cap by {gap:.0%}** — you're delivering beyond what your "
+    "processes support. In practice: shipping without adequate testing, deploying "
+    "without proper review, making commitments governance can't back up. "
+    "**{comp}** ({comp_value:.2f}) absorbs {extent} of this — "
+)
+_GAP_OPS_OVER = (
+    (_GAP_OPS_OVER_BODY + "automation/effort compensates for the process gap.").format,
+    (_GAP_OPS_OVER_BODY + "but not enough. Need more **Recovery** (automation) "
+     "or **Overwork** to sustain delivery without process.").format,
+)
+_DEBT_NONE = "Maturity high enough — no compounding debt."
+_DEBT_ACCRUING = (
+    "Average maturity ({avg:.0%}) is below 30%. Technical debt, knowledge gaps, "
+    "and undocumented decisions are accumulating faster than they're resolved."
+).format
+_PROC_LOW = "Low capability ({cap:.0%}) means minimal governance overhead.".format
+_PROC_COST_BODY = (
+    "Maintaining Cap={cap:.0%} costs {cost:.3f}. "
+    "This covers: documentation standards, quality gates, review processes, "
+    "compliance evidence, training. "
+)
+_PROC_COST = (
+    _PROC_COST_BODY.format,
+    (_PROC_COST_BODY + "This is significant — **increase Investment** to reduce the burden.").format,
+)
+_EXEC_LOW = "Low operations ({ops:.0%}) means minimal delivery overhead.".format
+_EXEC_COST_BODY = (
+    "Sustaining Ops={ops:.0%} costs {cost:.3f}. "
+    "This covers: delivery cadence, deployment pipelines, incident response, "
+    "monitoring, release management. "
+    "Best compensator: **{comp}** ({comp_value:.2f}). "
+)
+_EXEC_COST = (
+    _EXEC_COST_BODY.format,
+    (_EXEC_COST_BODY + "Consider increasing **{comp}** to reduce this.").format,
+)
+_NET = "Net: {net:.3f} vs threshold {threshold:.2f} (relief: -{relief:.3f})".format
+
+
+@dataclass(frozen=True, slots=True)
+class Breakdown:
+    """The cost_breakdown fields the captions use, as a compact hashable record."""
+    cap: float
+    ops: float
+    gap: float
+    gap_direction: str
+    gap_compensator: str
+    gap_compensator_value: float
+    gap_cost: float
+    debt_cost: float
+    process_cost: float
+    execution_cost: float
+    exec_compensator: str
+    exec_compensator_value: float
+    net_cost: float
+    threshold: float
+    investment_relief: float
+
+    @classmethod
+    def from_dict(cls, bd: dict) -> Breakdown:
+        """Pick this record's fields out of a cost_breakdown dict."""
+        return cls(**{f: bd[f] for f in cls.__slots__})
+
+
+@functools.lru_cache(maxsize=64)
+def _pick_templates(gap_balanced: bool, cap_over: bool, gap_short: bool,
+                    proc_low: bool, proc_high: bool,
+                    exec_low: bool, exec_high: bool) -> tuple:
+    """Gap, process and execution caption templates for one set of flags.
+
+    Every template is a bound str.format, so callers pass the same keyword
+    arguments whichever branch was picked (unused ones are ignored).
+    """
+    if gap_balanced:
+        gap_fmt = _GAP_BALANCED.format
+    else:
+        gap_fmt = (_GAP_CAP_OVER if cap_over else _GAP_OPS_OVER)[gap_short]
+    proc_fmt = _PROC_LOW if proc_low else _PROC_COST[proc_high]
+    exec_fmt = _EXEC_LOW if exec_low else _EXEC_COST[exec_high]
+    return gap_fmt, proc_fmt, exec_fmt
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _breakdown_captions(bd: Breakdown) -> tuple[str, str, str, str, str]:
+    """Build the Gap/Debt/Process/Execution/Net captions for a breakdown.
+
+    Cached on the frozen Breakdown record, so reruns at an unchanged
+    position skip all formatting.
+    """
+    cap, ops, gap, gc = bd.cap, bd.ops, bd.gap, bd.gap_cost
+    dc, pc, ec = bd.debt_cost, bd.process_cost, bd.execution_cost
+
+    gap_short = gc >= _GAP_COST_HIGH
+    gap_fmt, proc_fmt, exec_fmt = _pick_templates(
+        gap < _GAP_BALANCED_MAX, bd.gap_direction == "Cap > Ops", gap_short,
+        pc < _COST_LOW, pc > _COST_HIGH, ec < _COST_LOW, ec > _COST_HIGH,
+    )
+
+    gap_text = gap_fmt(
+        gap=gap, comp=bd.gap_compensator, comp_value=bd.gap_compensator_value,
+        extent=_GAP_EXTENT[gap_short],
+    )
+    if dc < _DEBT_COST_MIN:
+        debt_text = _DEBT_NONE
+    else:
+        debt_text = _DEBT_ACCRUING(avg=(cap + ops) * 0.5)
+    proc_text = proc_fmt(cap=cap, cost=pc)
+    exec_text = exec_fmt(
+        ops=ops, cost=ec, comp=bd.exec_compensator,
+        comp_value=bd.exec_compensator_value,
+    )
+
+    return (
+        f"**Gap**: {gap_text}",
+        f"**Debt**: {debt_text}",
+        f"**Process**: {proc_text}",
+        f"**Execution**: {exec_text}",
+        _NET(net=bd.net_cost, threshold=bd.threshold, relief=bd.investment_relief),
+    )
+
+
 def render_cost_breakdown(bd: dict):
     """Display the full cost decomposition for the inspected position."""
     st.markdown("#### Cost Breakdown")
@@ -928,79 +1146,9 @@ def render_cost_breakdown(bd: dict):
     )
     st.plotly_chart(fig, use_container_width=True)
 
-    # Detailed cost explanations with real-world context
-    # Gap cost
-    if bd["gap"] < 0.02:
-        gap_text = "Cap and Ops are balanced — no mismatch penalty."
-    elif bd["gap_direction"] == "Cap > Ops":
-        gap_text = (
-            f"**Cap > Ops by {bd['gap']:.0%}** — you have more governance/process "
-            f"than delivery output. In practice: review cycles with little to review, "
-            f"compliance checkpoints with few deliverables passing through, quality gates "
-            f"that slow work but aren't justified by throughput. "
-            f"**{bd['gap_compensator']}** ({bd['gap_compensator_value']:.2f}) absorbs "
-            f"{'most' if bd['gap_cost'] < 0.05 else 'some'} of this — "
-        )
-        if bd["gap_cost"] < 0.05:
-            gap_text += "the organisation can afford to be slow and thorough."
-        else:
-            gap_text += "but not enough. Need more **Time** (schedule slack) to justify heavy process with low output."
-    else:
-        gap_text = (
-            f"**Ops > Cap by {bd['gap']:.0%}** — you're delivering beyond what your "
-            f"processes support. In practice: shipping without adequate testing, deploying "
-            f"without proper review, making commitments governance can't back up. "
-            f"**{bd['gap_compensator']}** ({bd['gap_compensator_value']:.2f}) absorbs "
-            f"{'most' if bd['gap_cost'] < 0.05 else 'some'} of this — "
-        )
-        if bd["gap_cost"] < 0.05:
-            gap_text += "automation/effort compensates for the process gap."
-        else:
-            gap_text += "but not enough. Need more **Recovery** (automation) or **Overwork** to sustain delivery without process."
-
-    # Debt cost
-    avg = (bd["cap"] + bd["ops"]) / 2
-    if bd["debt_cost"] < 0.01:
-        debt_text = "Maturity high enough — no compounding debt."
-    else:
-        debt_text = (
-            f"Average maturity ({avg:.0%}) is below 30%. Technical debt, knowledge gaps, "
-            f"and undocumented decisions are accumulating faster than they're resolved."
-        )
-
-    # Process cost
-    if bd["process_cost"] < 0.03:
-        proc_text = f"Low capability ({bd['cap']:.0%}) means minimal governance overhead."
-    else:
-        proc_text = (
-            f"Maintaining Cap={bd['cap']:.0%} costs {bd['process_cost']:.3f}. "
-            f"This covers: documentation standards, quality gates, review processes, "
-            f"compliance evidence, training. "
-        )
-        if bd["process_cost"] > 0.10:
-            proc_text += "This is significant — **increase Investment** to reduce the burden."
-
-    # Execution cost
-    if bd["execution_cost"] < 0.03:
-        exec_text = f"Low operations ({bd['ops']:.0%}) means minimal delivery overhead."
-    else:
-        exec_text = (
-            f"Sustaining Ops={bd['ops']:.0%} costs {bd['execution_cost']:.3f}. "
-            f"This covers: delivery cadence, deployment pipelines, incident response, "
-            f"monitoring, release management. "
-            f"Best compensator: **{bd['exec_compensator']}** ({bd['exec_compensator_value']:.2f}). "
-        )
-        if bd["execution_cost"] > 0.10:
-            exec_text += f"Consider increasing **{bd['exec_compensator']}** to reduce this."
-
-    st.caption(f"**Gap**: {gap_text}")
-    st.caption(f"**Debt**: {debt_text}")
-    st.caption(f"**Process**: {proc_text}")
-    st.caption(f"**Execution**: {exec_text}")
-    st.caption(
-        f"Net: {bd['net_cost']:.3f} vs threshold {bd['threshold']:.2f} "
-        f"(relief: -{bd['investment_relief']:.3f})"
-    )
+    # Detailed cost explanations with real-world context, sent as one
+    # caption element (one paragraph each) rather than five
+    st.caption("\n\n".join(_breakdown_captions(Breakdown.from_dict(bd))))
 
 
 # ---------------------------------------------------------------------------
@@ -1041,7 +1189,7 @@ def main():
     is_gradient = (layer == GRADIENT_MODE)
 
     # Zone metrics
-    zone_area, cap_range, ops_range = compute_zone_metrics(grid)
+    zone_area, cap_range, ops_range, viable_mask = compute_zone_metrics(grid)
     cap_floor = compute_cap_floor(dims)
     ops_floor = compute_ops_floor(dims)
 
@@ -1105,6 +1253,7 @@ def main():
             is_gradient=is_gradient,
             show_floors=show_floors,
             show_default=show_default,
+            viable_mask=viable_mask,
         )
         fig.update_layout(height=500)
         st.plotly_chart(fig, use_container_width=True)